@@ -3,11 +3,14 @@ Project-wide interpreter bootstrap.
 
 Python automatically imports this module (if present on sys.path) after the
 standard `site` initialisation. We leverage it to ensure compatibility patches
-are applied in every process, including LiveKit worker subprocesses spawned via
-`multiprocessing`.
+are applied in every agent process, including LiveKit worker subprocesses
+spawned via `multiprocessing`. `run_cli` sets VOICE_AGENT_BOOTSTRAP=1 for its
+children; unrelated tools in the same venv (pip, pytest, ...) skip it.
 """
 
-from voice_agent.compat import bootstrap
+import os
 
-bootstrap()
+if os.environ.get("VOICE_AGENT_BOOTSTRAP") == "1":
+    from voice_agent.compat import bootstrap
 
+    bootstrap()
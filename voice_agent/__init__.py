@@ -1,5 +1,17 @@
-from .cli import run_cli
-from .runtime.entrypoint import run_job
+from typing import Any
 
 __all__ = ["run_cli", "run_job"]
 
+
+def __getattr__(name: str) -> Any:
+    # Resolved lazily: sitecustomize imports voice_agent.compat in every
+    # interpreter and should not drag in the CLI, tools and asyncio with it.
+    if name == "run_cli":
+        from .cli import run_cli
+
+        return run_cli
+    if name == "run_job":
+        from .runtime.entrypoint import run_job
+
+        return run_job
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,18 +1,27 @@
-import asyncio
 from typing import Any, Optional
 
-from .tools import browser, rss, search, time_tools, video
+_LIVEKIT: Optional[tuple[Any, Any, Any]] = None
+_LIVEKIT_IMPORT_ERROR: Optional[ImportError] = None
+_AGENT_CLASS: Optional[type] = None
 
-try:
-    from livekit.agents import Agent as _AgentBase, RunContext as _RunContext
-    from livekit.agents.llm import function_tool as _function_tool
-except ImportError as exc:  # pragma: no cover - local dev without LiveKit
-    _AgentBase = None  # type: ignore[assignment]
-    _RunContext = None  # type: ignore[assignment]
-    _function_tool = None  # type: ignore[assignment]
-    LIVEKIT_IMPORT_ERROR: Optional[ImportError] = exc
-else:
-    LIVEKIT_IMPORT_ERROR = None
+
+def _import_livekit() -> Optional[ImportError]:
+    """
+    Import the LiveKit agent primitives on first use and remember the outcome.
+    Keeps `import voice_agent` (and the demo fallback) free of the LiveKit
+    dependency tree. Returns the ImportError when LiveKit is unavailable.
+    """
+
+    global _LIVEKIT, _LIVEKIT_IMPORT_ERROR
+    if _LIVEKIT is None and _LIVEKIT_IMPORT_ERROR is None:
+        try:
+            from livekit.agents import Agent as _AgentBase, RunContext as _RunContext
+            from livekit.agents.llm import function_tool as _function_tool
+        except ImportError as exc:  # pragma: no cover - local dev without LiveKit
+            _LIVEKIT_IMPORT_ERROR = exc
+        else:
+            _LIVEKIT = (_AgentBase, _RunContext, _function_tool)
+    return _LIVEKIT_IMPORT_ERROR
 
 
 class _AgentStub:
@@ -22,58 +31,107 @@ class _AgentStub:
         )
 
 
-AgentBase = _AgentBase if _AgentBase is not None else _AgentStub
-RunContext = _RunContext if _RunContext is not None else Any  # type: ignore
+def _agent_base() -> Any:
+    _import_livekit()
+    return _LIVEKIT[0] if _LIVEKIT is not None else _AgentStub
+
+
+def _run_context() -> Any:
+    _import_livekit()
+    return _LIVEKIT[1] if _LIVEKIT is not None else Any
+
+
+def _identity(func: Any) -> Any:
+    return func
 
 
 def function_tool(func):  # type: ignore[misc]
-    if _function_tool is None:  # pragma: no cover - fallback
+    _import_livekit()
+    if _LIVEKIT is None:  # pragma: no cover - fallback
         return func
-    return _function_tool(func)
-
-
-class GeminiVisionAgent(AgentBase):
-    """Agent that exposes a small set of reusable function tools."""
-
-    def __init__(self, *, instructions: str) -> None:
-        super().__init__(instructions=instructions)
-        self._video_toggle_lock = asyncio.Lock()
-
-    # Video tools commented out to prevent hallucinations about controlling user hardware
-    # @function_tool
-    # async def enable_video_feed(self, _: RunContext) -> str:
-    #     async with self._video_toggle_lock:
-    #         return await video.enable_video_feed(self)
-
-    # @function_tool
-    # async def disable_video_feed(self, _: RunContext) -> str:
-    #     async with self._video_toggle_lock:
-    #         return await video.disable_video_feed(self)
-
-    @function_tool
-    async def current_time_utc_plus3(self, _: RunContext) -> str:
-        return await time_tools.current_time_utc_plus3(None)
-
-    @function_tool
-    async def browse_web_page(
-        self,
-        _: RunContext,
-        url: str,
-        wait: Any = "",
-        max_chars: int | str = 0,
-    ) -> str:
-        return await browser.browse_web_page(None, url, wait=wait, max_chars=max_chars)
-
-    @function_tool
-    async def fetch_rss_news(
-        self, _: RunContext, feed_url: str = "", limit: int | str = 3
-    ) -> str:
-        return await rss.fetch_rss_news(None, feed_url=feed_url, limit=limit)
-    fetch_rss_news.__doc__ = rss.describe_feed_catalog()
-
-    @function_tool
-    async def google_search_api(self, _: RunContext, query: str, limit: int | str = 5) -> str:
-        return await search.google_search_api(None, query=query, limit=limit)
+    return _LIVEKIT[2](func)
+
+
+def _build_agent_class() -> type:
+    """
+    Define GeminiVisionAgent on first call, once the LiveKit base class has
+    been imported, and reuse the same class afterwards.
+    """
+
+    global _AGENT_CLASS
+    if _AGENT_CLASS is not None:
+        return _AGENT_CLASS
+
+    # Tool modules are imported when first needed (browser pulls in Playwright);
+    # rss is needed here for the catalog docstring and is already loaded by config.
+    from .tools import rss
+
+    AgentBase = _agent_base()
+    RunContext = _run_context()
+    # Resolve the decorator once for the class body instead of per decorated method.
+    function_tool = _LIVEKIT[2] if _LIVEKIT is not None else _identity
+
+    class GeminiVisionAgent(AgentBase):
+        """Agent that exposes a small set of reusable function tools."""
+
+        # Video tools commented out to prevent hallucinations about controlling user hardware
+        # @function_tool
+        # async def enable_video_feed(self, _: RunContext) -> str:
+        #     from .tools import video
+        #     return await video.enable_video_feed(self)
+
+        # @function_tool
+        # async def disable_video_feed(self, _: RunContext) -> str:
+        #     from .tools import video
+        #     return await video.disable_video_feed(self)
+
+        @function_tool
+        async def current_time_utc_plus3(self, _: RunContext) -> str:
+            from .tools import time_tools
+
+            return await time_tools.current_time_utc_plus3(None)
+
+        @function_tool
+        async def browse_web_page(
+            self,
+            _: RunContext,
+            url: str,
+            wait: Any = "",
+            max_chars: int | str = 0,
+        ) -> str:
+            from .tools import browser
+
+            return await browser.browse_web_page(None, url, wait=wait, max_chars=max_chars)
+
+        @function_tool
+        async def fetch_rss_news(
+            self, _: RunContext, feed_url: str = "", limit: int | str = 3
+        ) -> str:
+            return await rss.fetch_rss_news(None, feed_url=feed_url, limit=limit)
+        fetch_rss_news.__doc__ = rss.describe_feed_catalog()
+
+        @function_tool
+        async def google_search_api(self, _: RunContext, query: str, limit: int | str = 5) -> str:
+            from .tools import search
+
+            return await search.google_search_api(None, query=query, limit=limit)
+
+    GeminiVisionAgent.__qualname__ = "GeminiVisionAgent"
+    _AGENT_CLASS = GeminiVisionAgent
+    return GeminiVisionAgent
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve the LiveKit-backed names lazily so importing this module stays cheap.
+    if name == "GeminiVisionAgent":
+        return _build_agent_class()
+    if name == "AgentBase":
+        return _agent_base()
+    if name == "RunContext":
+        return _run_context()
+    if name == "LIVEKIT_IMPORT_ERROR":
+        return _import_livekit()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
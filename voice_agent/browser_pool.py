@@ -1,13 +1,27 @@
 import asyncio
+import functools
+import logging
+import os
+import re
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Optional, Tuple
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
 
 try:
     from playwright.async_api import async_playwright  # type: ignore
 except ImportError:  # pragma: no cover - playwright optional
     async_playwright = None  # type: ignore[assignment]
 
+_BROWSER_LOGGER = logging.getLogger("voice-agent.browser")
+
+# Released pages kept open (on about:blank) per context for the next call with that config.
+_MAX_IDLE_PAGES = 2
+# Idle contexts beyond this many are closed least recently used first when a new
+# config needs one; contexts with pages in flight are never evicted.
+_MAX_CONTEXTS = 4
+
 _STEALTH_SNIPPET = """
 Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
 window.chrome = window.chrome || { runtime: {} };
@@ -21,6 +35,36 @@ if (originalQuery) {
 """
 
 
+# Injected as a stylesheet as soon as the document exists; animations and
+# transitions only cost layout/paint time on pages we read as text.
+_ANIMATION_KILL_SNIPPET = """
+(() => {
+  const addStyle = () => {
+    const style = document.createElement('style');
+    style.textContent = '*,*::before,*::after{animation:none!important;transition:none!important}';
+    (document.head || document.documentElement).appendChild(style);
+  };
+  if (document.documentElement) {
+    addStyle();
+  } else {
+    document.addEventListener('DOMContentLoaded', addStyle, { once: true });
+  }
+})();
+"""
+
+
+def _compact_js(*snippets: str) -> str:
+    # The snippets use explicit semicolons/braces, so dropping indentation and blank
+    # lines is safe; the result is one script sent once per context.
+    return "\n".join(
+        line.strip() for snippet in snippets for line in snippet.splitlines() if line.strip()
+    )
+
+
+_INIT_SCRIPT = _compact_js(_STEALTH_SNIPPET)
+_INIT_SCRIPT_NO_ANIMATIONS = _compact_js(_STEALTH_SNIPPET, _ANIMATION_KILL_SNIPPET)
+
+
 @dataclass(frozen=True)
 class ProxyConfig:
     server: str
@@ -37,25 +81,92 @@ class BrowserContextConfig:
     timezone_id: str
     viewport: Tuple[int, int]
     proxy: Optional[ProxyConfig]
+    # Requests aborted by a context-level route: Playwright resource types,
+    # lowercase URL suffixes and regexes searched in the lowercase URL.
+    blocked_resource_types: frozenset[str] = frozenset()
+    blocked_extensions: Tuple[str, ...] = ()
+    block_url_patterns: Tuple[str, ...] = ()
+    disable_animations: bool = False
+    # Opt-in on-disk profile: the context is launched persistently so HTTP and
+    # service-worker caches and cookies survive browser and agent restarts.
+    user_data_dir: Optional[str] = None
+
+    @functools.cached_property
+    def _hash(self) -> int:
+        return hash(tuple(getattr(self, item.name) for item in fields(self)))
+
+    def __hash__(self) -> int:
+        # The pool looks configs up by hash several times per acquire; hash the
+        # (immutable) fields once instead of on every dict access.
+        return self._hash
+
+    @functools.cached_property
+    def proxy_settings(self) -> Optional[Mapping[str, str]]:
+        """The Playwright ``proxy`` option for this config, without empty values."""
+
+        proxy = self.proxy
+        if proxy is None:
+            return None
+        return MappingProxyType(
+            {
+                key: value
+                for key, value in (
+                    ("server", proxy.server),
+                    ("username", proxy.username),
+                    ("password", proxy.password),
+                    ("bypass", proxy.bypass),
+                )
+                if value
+            }
+        )
+
+    @functools.cached_property
+    def launch_kwargs(self) -> Mapping[str, Any]:
+        """Chromium launch options for this config (everything but the timeout)."""
+
+        kwargs: dict[str, Any] = {"headless": True, "args": list(self.chromium_args)}
+        if self.proxy_settings is not None:
+            kwargs["proxy"] = dict(self.proxy_settings)
+        return MappingProxyType(kwargs)
+
+
+@dataclass(slots=True)
+class _ContextEntry:
+    """One browser context per distinct config, with its own warm pages."""
+
+    context: Any
+    persistent: bool = False
+    active_pages: int = 0
+    last_used: float = 0.0
+    # Set while release_page clears the context's cookies; acquires take the slow path.
+    resetting: bool = False
+    # (page, released_at), most recently released last: acquire pops the warm end.
+    idle_pages: list[Tuple[Any, float]] = field(default_factory=list)
 
 
 class PlaywrightBrowserPool:
     """
     Lazily launch a headless Chromium instance and reuse it across tool calls.
-    Automatically tears down the browser after a configurable idle timeout.
+    Each distinct BrowserContextConfig gets its own context, so calls with
+    different user agents or locales run side by side instead of tearing one
+    shared context down. Contexts unused for the idle timeout are closed, and
+    the browser itself after the whole pool has been idle that long.
     """
 
     def __init__(self) -> None:
         self._lock = asyncio.Lock()
         self._playwright: Any = None
         self._browser: Any = None
-        self._context: Any = None
-        self._context_config: Optional[BrowserContextConfig] = None
+        self._contexts: dict[BrowserContextConfig, _ContextEntry] = {}
+        # Keyed by config, or by profile dir for persistent contexts.
+        self._context_locks: dict[Any, asyncio.Lock] = {}
         self._chromium_args: Tuple[str, ...] | None = None
         self._active_pages = 0
         self._idle_timeout = 60.0
         self._last_used = 0.0
         self._idle_task: Optional[asyncio.Task[None]] = None
+        # Set whenever a cleanup deadline may have moved; the idle task recomputes.
+        self._idle_wake = asyncio.Event()
 
     async def acquire_page(
         self,
@@ -70,36 +181,188 @@ class PlaywrightBrowserPool:
                 "`python -m playwright install chromium`."
             )
 
-        # Ensure browser/context exist with the requested configuration.
+        idle_timeout = max(0.0, idle_timeout_s)
+        if idle_timeout != self._idle_timeout:
+            self._idle_timeout = idle_timeout
+            self._idle_wake.set()
+
+        entry = self._contexts.get(config)
+        chromium_args = self._chromium_args
+        if (
+            entry is not None
+            and not entry.resetting
+            and (chromium_args is config.chromium_args or chromium_args == config.chromium_args)
+        ):
+            # Warm context: there is no await between this check and the counters, so
+            # on the single-threaded loop nothing can evict it; skip the pool lock.
+            self._active_pages += 1
+            entry.active_pages += 1
+            entry.last_used = self._last_used = time.monotonic()
+            page = entry.idle_pages.pop()[0] if entry.idle_pages else None
+        else:
+            entry, page = await self._acquire_slow(config, launch_timeout_ms)
+
+        if page is None:
+            try:
+                page = await entry.context.new_page()
+            except BaseException:
+                self._active_pages = max(0, self._active_pages - 1)
+                entry.active_pages = max(0, entry.active_pages - 1)
+                self._idle_wake.set()
+                raise
+        return page
+
+    async def _acquire_slow(
+        self, config: BrowserContextConfig, launch_timeout_ms: int
+    ) -> Tuple[_ContextEntry, Any]:
+        """Launch the browser and/or create the context for ``config`` if needed."""
+
+        evicted: list[Any] = []
+        lock_key = config.user_data_dir or config
+        # Only the browser launch is serialised pool-wide.
         async with self._lock:
-            self._idle_timeout = max(0.0, idle_timeout_s)
             await self._ensure_browser_locked(config=config, launch_timeout_ms=launch_timeout_ms)
             self._active_pages += 1
             self._last_used = time.monotonic()
-            context = self._context
+            playwright = self._playwright
+            browser = self._browser
+            if config not in self._contexts:
+                evicted = self._evict_idle_contexts_locked(_MAX_CONTEXTS - 1)
+            context_lock = self._context_locks.setdefault(lock_key, asyncio.Lock())
+        await self._shutdown_objects(evicted, None, None)
 
-        page = await context.new_page()
-        return page
+        try:
+            # Contexts for other configs are created concurrently under their own locks.
+            while True:
+                async with context_lock:
+                    current_lock = self._context_locks.setdefault(lock_key, context_lock)
+                    if current_lock is not context_lock:
+                        # The lock was dropped with its context while we waited.
+                        context_lock = current_lock
+                        continue
+                    entry = self._contexts.get(config)
+                    if entry is None:
+                        if config.user_data_dir is not None:
+                            await self._free_profile(config.user_data_dir)
+                        context = await self._new_context(
+                            playwright, browser, config, max(1000, launch_timeout_ms)
+                        )
+                        # Counted as busy from the moment it is visible, so neither LRU
+                        # eviction nor the idle task can close it under this caller.
+                        entry = _ContextEntry(
+                            context,
+                            persistent=config.user_data_dir is not None,
+                            active_pages=1,
+                            last_used=time.monotonic(),
+                        )
+                        self._contexts[config] = entry
+                        page = None
+                        break
+                    # release_page resets an idle entry under the pool lock; taking it
+                    # here means a page is never handed out mid-reset.
+                    async with self._lock:
+                        if self._contexts.get(config) is not entry:
+                            # Evicted while this caller waited for the pool lock.
+                            continue
+                        entry.active_pages += 1
+                        entry.last_used = time.monotonic()
+                        page = entry.idle_pages.pop()[0] if entry.idle_pages else None
+                    break
+        except BaseException:
+            self._active_pages = max(0, self._active_pages - 1)
+            self._idle_wake.set()
+            raise
+        return entry, page
 
     async def release_page(self, page: Any) -> None:
-        try:
-            await page.close()
-        except Exception:  # pragma: no cover - defensive cleanup
-            pass
+        reusable = await self._reset_page(page)
 
         async with self._lock:
+            now = time.monotonic()
+            entry = self._entry_for_context(page.context)
+            keep = False
+            if entry is not None:
+                entry.active_pages = max(0, entry.active_pages - 1)
+                entry.last_used = now
+                keep = (
+                    reusable
+                    and self._idle_timeout > 0.0
+                    and len(entry.idle_pages) < _MAX_IDLE_PAGES
+                )
+                if entry.active_pages == 0 and self._idle_timeout > 0.0 and not entry.persistent:
+                    # The next call starts without this call's session state. Cookies
+                    # are context-wide, so no page may be handed out until they are gone.
+                    entry.resetting = True
+                    try:
+                        await entry.context.clear_cookies()
+                    except Exception:  # pragma: no cover - defensive cleanup
+                        pass
+                    finally:
+                        entry.resetting = False
+                if keep:
+                    entry.idle_pages.append((page, now))
             self._active_pages = max(0, self._active_pages - 1)
-            self._last_used = time.monotonic()
+            self._last_used = now
+            self._idle_wake.set()
+
+            if self._active_pages == 0 and self._idle_timeout <= 0.0:
+                browser = self._browser
+                contexts = self._contexts_locked()
+                playwright = self._playwright
+                self._reset_locked()
+                await self._shutdown_objects(contexts, browser, playwright)
+            elif self._idle_task is None and self._playwright is not None:
+                self._idle_task = asyncio.create_task(self._idle_cleanup())
+
+        if not keep:
+            try:
+                await page.close()
+            except Exception:  # pragma: no cover - defensive cleanup
+                pass
 
-            if self._active_pages == 0:
-                if self._idle_timeout <= 0.0:
-                    browser = self._browser
-                    context = self._context
-                    playwright = self._playwright
-                    self._reset_locked()
-                    await self._shutdown_objects(context, browser, playwright)
-                elif self._idle_task is None:
-                    self._idle_task = asyncio.create_task(self._idle_cleanup())
+    def _entry_for_context(self, context: Any) -> Optional[_ContextEntry]:
+        for entry in self._contexts.values():
+            if entry.context is context:
+                return entry
+        return None
+
+    def _contexts_locked(self) -> list[Any]:
+        return [entry.context for entry in self._contexts.values()]
+
+    def _drop_context_locked(self, config: BrowserContextConfig) -> Any:
+        """Forget ``config``'s context (the caller closes it) and its creation lock."""
+
+        entry = self._contexts.pop(config)
+        lock_key = config.user_data_dir or config
+        lock = self._context_locks.get(lock_key)
+        # A held lock belongs to a creator for the same key (a profile dir shared by
+        # several configs); waiters on a dropped lock retry with a fresh one.
+        if lock is not None and not lock.locked():
+            del self._context_locks[lock_key]
+        return entry.context
+
+    def _evict_idle_contexts_locked(self, limit: int) -> list[Any]:
+        """Drop least recently used idle contexts until at most ``limit`` remain."""
+
+        excess = len(self._contexts) - limit
+        if excess <= 0:
+            return []
+        idle = sorted(
+            (config for config, entry in self._contexts.items() if entry.active_pages == 0),
+            key=lambda config: self._contexts[config].last_used,
+        )
+        return [self._drop_context_locked(config) for config in idle[:excess]]
+
+    @staticmethod
+    async def _reset_page(page: Any) -> bool:
+        """Drop per-call routes and navigate away so the page can be handed out again."""
+
+        try:
+            await page.unroute_all(behavior="ignoreErrors")
+            await page.goto("about:blank")
+        except Exception:
+            return False
+        return not page.is_closed()
 
     async def _ensure_browser_locked(
         self,
@@ -111,100 +374,188 @@ class PlaywrightBrowserPool:
 
         launch_timeout_ms = max(1000, launch_timeout_ms)
 
-        need_new_browser = (
-            self._browser is None
-            or self._chromium_args != config.chromium_args
-        )
-        browser_to_close = None
-        context_to_close = None
-        playwright_to_stop = None
-
-        if need_new_browser and self._browser is not None:
+        chromium_args = self._chromium_args
+        if (
+            chromium_args is not None
+            and chromium_args is not config.chromium_args
+            and chromium_args != config.chromium_args
+        ):
+            # Contexts belong to the old browser and close with it.
             browser_to_close = self._browser
-            context_to_close = self._context
+            contexts_to_close = self._contexts_locked()
             playwright_to_stop = self._playwright
-            self._context = None
-            self._browser = None
-            self._playwright = None
-            self._context_config = None
-            self._chromium_args = None
-
-        if browser_to_close or context_to_close or playwright_to_stop:
-            await self._shutdown_objects(context_to_close, browser_to_close, playwright_to_stop)
-
-        if self._browser is None:
-            if self._playwright is None:
-                self._playwright = await async_playwright().start()
-            launch_params = dict(
-                headless=True,
-                args=list(config.chromium_args),
+            self._reset_locked()
+            await self._shutdown_objects(contexts_to_close, browser_to_close, playwright_to_stop)
+
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        # Persistent contexts launch their own Chromium; the shared one starts on demand.
+        if self._browser is None and config.user_data_dir is None:
+            cdp_url = os.getenv("VOICE_AGENT_CDP_URL", "").strip()
+            if cdp_url:
+                # A Chromium shared by several workers: no launch here, and its own
+                # launch flags/proxy apply. close() on it only disconnects.
+                try:
+                    self._browser = await self._playwright.chromium.connect_over_cdp(
+                        cdp_url, timeout=launch_timeout_ms
+                    )
+                except Exception as exc:
+                    _BROWSER_LOGGER.warning(
+                        "Could not connect to Chromium at %s (%s); launching a local browser.",
+                        cdp_url,
+                        exc,
+                    )
+            if self._browser is None:
+                self._browser = await self._playwright.chromium.launch(
+                    **config.launch_kwargs, timeout=launch_timeout_ms
+                )
+        self._chromium_args = config.chromium_args
+
+    async def _free_profile(self, user_data_dir: str) -> None:
+        """A Chromium profile dir can back only one persistent context at a time."""
+
+        for other_config, other in list(self._contexts.items()):
+            if other_config.user_data_dir != user_data_dir:
+                continue
+            if other.active_pages:
+                raise RuntimeError(f"Browser profile {user_data_dir} is already in use.")
+            del self._contexts[other_config]
+            await self._shutdown_objects([other.context], None, None)
+
+    @staticmethod
+    async def _new_context(
+        playwright: Any, browser: Any, config: BrowserContextConfig, launch_timeout_ms: int
+    ) -> Any:
+        viewport_width, viewport_height = config.viewport
+        options = dict(
+            user_agent=config.user_agent,
+            locale=config.locale,
+            viewport={"width": viewport_width, "height": viewport_height},
+            timezone_id=config.timezone_id,
+        )
+        if config.user_data_dir is not None:
+            context = await playwright.chromium.launch_persistent_context(
+                config.user_data_dir,
+                **config.launch_kwargs,
+                **options,
                 timeout=launch_timeout_ms,
             )
-            if config.proxy is not None:
-                launch_params["proxy"] = {
-                    "server": config.proxy.server,
-                }
-                if config.proxy.username:
-                    launch_params["proxy"]["username"] = config.proxy.username
-                if config.proxy.password:
-                    launch_params["proxy"]["password"] = config.proxy.password
-                if config.proxy.bypass:
-                    launch_params["proxy"]["bypass"] = config.proxy.bypass
-            self._browser = await self._playwright.chromium.launch(**launch_params)
-            self._chromium_args = config.chromium_args
-
-        if self._context is None or self._context_config != config:
-            if self._context is not None:
-                await self._context.close()
-            viewport_width, viewport_height = config.viewport
-            self._context = await self._browser.new_context(
-                user_agent=config.user_agent,
-                locale=config.locale,
-                viewport={"width": viewport_width, "height": viewport_height},
-                timezone_id=config.timezone_id,
-            )
-            await self._context.add_init_script(_STEALTH_SNIPPET)
-            self._context_config = config
-
-        if self._idle_task is not None and self._active_pages == 0:
-            # Cancel pending idle shutdown if a new page is requested while idle.
-            self._idle_task.cancel()
-            self._idle_task = None
+        else:
+            if config.proxy_settings is not None:
+                # The shared browser keeps whichever proxy it launched with; each
+                # context routes through its own so every config gets its proxy.
+                options["proxy"] = dict(config.proxy_settings)
+            context = await browser.new_context(**options)
+        await context.add_init_script(
+            _INIT_SCRIPT_NO_ANIMATIONS if config.disable_animations else _INIT_SCRIPT
+        )
+        # URL-based blocking is matched by the Playwright driver and its handler only
+        # aborts. Resource types are only known per request, so blocking them needs a
+        # catch-all handler that still sees every request in Python (the default for
+        # browse_web_page); it falls back to the URL route for what it lets through.
+        block_pattern = _compile_block_pattern(
+            config.blocked_extensions, config.block_url_patterns
+        )
+        if block_pattern is not None:
+            await context.route(block_pattern, _abort_route)
+        if config.blocked_resource_types:
+            await context.route("**/*", _resource_type_router(config.blocked_resource_types))
+        return context
+
+    def _next_idle_deadline_locked(self) -> Optional[float]:
+        """Earliest monotonic time at which something may be idle for the timeout."""
+
+        timeout = self._idle_timeout
+        deadlines = [
+            entry.last_used + timeout
+            for entry in self._contexts.values()
+            if entry.active_pages == 0
+        ]
+        deadlines.extend(
+            entry.idle_pages[0][1] + timeout
+            for entry in self._contexts.values()
+            if entry.idle_pages
+        )
+        if self._active_pages == 0:
+            deadlines.append(self._last_used + timeout)
+        return min(deadlines) if deadlines else None
 
     async def _idle_cleanup(self) -> None:
         try:
             while True:
-                timeout = self._idle_timeout
-                await asyncio.sleep(timeout)
                 async with self._lock:
+                    if self._playwright is None:
+                        self._idle_task = None
+                        break
+                    self._idle_wake.clear()
+                    deadline = self._next_idle_deadline_locked()
+                # No deadline while every context is busy: sleep until a release.
+                delay = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    await asyncio.wait_for(self._idle_wake.wait(), timeout=delay)
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+
+                stale_pages: list[Any] = []
+                stale_contexts: list[Any] = []
+                async with self._lock:
+                    timeout = self._idle_timeout
                     now = time.monotonic()
-                    if self._active_pages > 0 or self._browser is None:
-                        continue
-                    if (now - self._last_used) < timeout:
-                        continue
-                    browser = self._browser
-                    context = self._context
-                    playwright = self._playwright
-                    self._reset_locked()
-                await self._shutdown_objects(context, browser, playwright)
+                    shutdown = (
+                        self._active_pages == 0
+                        and self._playwright is not None
+                        and (now - self._last_used) >= timeout
+                    )
+                    if shutdown:
+                        browser = self._browser
+                        contexts = self._contexts_locked()
+                        playwright = self._playwright
+                        self._reset_locked()
+                        # A browser launched while this one shuts down gets a new task.
+                        self._idle_task = None
+                    else:
+                        for config, entry in list(self._contexts.items()):
+                            if entry.active_pages == 0 and (now - entry.last_used) >= timeout:
+                                # Unused config: its pages close with the context.
+                                stale_contexts.append(self._drop_context_locked(config))
+                                continue
+                            # Idle pages are ordered by release time; the oldest sit at the front.
+                            while entry.idle_pages and now - entry.idle_pages[0][1] >= timeout:
+                                stale_pages.append(entry.idle_pages.pop(0)[0])
+                if not shutdown:
+                    await self._close_pages(stale_pages)
+                    await self._shutdown_objects(stale_contexts, None, None)
+                    continue
+                await self._shutdown_objects(contexts, browser, playwright)
                 break
         except asyncio.CancelledError:  # pragma: no cover - cooperative cancellation
             raise
         finally:
             async with self._lock:
-                self._idle_task = None
+                if self._idle_task is asyncio.current_task():
+                    self._idle_task = None
+
+    @staticmethod
+    async def _close_pages(pages: list[Any]) -> None:
+        for page in pages:
+            try:
+                await page.close()
+            except Exception:  # pragma: no cover - defensive cleanup
+                pass
 
     def _reset_locked(self) -> None:
         self._browser = None
-        self._context = None
         self._playwright = None
-        self._context_config = None
+        self._contexts.clear()
+        self._context_locks.clear()
         self._chromium_args = None
         self._last_used = time.monotonic()
+        self._idle_wake.set()
 
     @staticmethod
-    async def _shutdown_objects(context: Any, browser: Any, playwright: Any) -> None:
-        if context is not None:
+    async def _shutdown_objects(contexts: list[Any], browser: Any, playwright: Any) -> None:
+        for context in contexts:
             try:
                 await context.close()
             except Exception:  # pragma: no cover - defensive cleanup
@@ -237,24 +588,61 @@ class PlaywrightBrowserPool:
     async def shutdown(self) -> None:
         async with self._lock:
             browser = self._browser
-            context = self._context
+            contexts = self._contexts_locked()
             playwright = self._playwright
-            if browser is None and context is None and playwright is None:
+            if browser is None and not contexts and playwright is None:
                 return
             if self._idle_task:
                 self._idle_task.cancel()
                 self._idle_task = None
             self._reset_locked()
-        await self._shutdown_objects(context, browser, playwright)
+        await self._shutdown_objects(contexts, browser, playwright)
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_block_pattern(
+    extensions: Tuple[str, ...], patterns: Tuple[str, ...]
+) -> Optional[re.Pattern[str]]:
+    alternatives = list(patterns)
+    if extensions:
+        # Match the path suffix even when a query string or fragment follows.
+        suffixes = "|".join(re.escape(ext) for ext in extensions)
+        alternatives.append(rf"(?:{suffixes})(?:[?#]|$)")
+    if not alternatives:
+        return None
+    return re.compile("|".join(f"(?:{pattern})" for pattern in alternatives), re.IGNORECASE)
+
+
+async def _abort_route(route: Any) -> None:
+    try:
+        await route.abort()
+    except Exception:
+        # The request may already be finished or handled elsewhere.
+        pass
+
+
+def _resource_type_router(blocked_types: frozenset[str]) -> Any:
+    async def _route_handler(route: Any) -> None:
+        if route.request.resource_type in blocked_types:
+            await _abort_route(route)
+        else:
+            # Fall through to the URL-pattern route, then to the network.
+            await route.fallback()
+
+    return _route_handler
 
 
 _POOL: Optional[PlaywrightBrowserPool] = None
+_POOL_LOCK = threading.Lock()
 
 
 def get_browser_pool() -> PlaywrightBrowserPool:
     global _POOL
     if _POOL is None:
-        _POOL = PlaywrightBrowserPool()
+        # Double-checked: callers on executor threads must not build a second pool.
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = PlaywrightBrowserPool()
     return _POOL
 
 
@@ -1,16 +1,49 @@
 import asyncio
+import concurrent.futures
 import os
 import sys
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Optional
+from urllib.parse import urlparse
 
-from .agent import LIVEKIT_IMPORT_ERROR
-from .config import AgentConfig, load_config, load_dotenv
+from .agent import _import_livekit
+from .config import AgentConfig, _env_bool, load_config, load_dotenv, resolve_agent_name
 from .runtime.entrypoint import run_job
 from .compat import bootstrap as bootstrap_compat
 
+_ENV_CLI_FLAGS = (
+    ("LIVEKIT_URL", "--url"),
+    ("LIVEKIT_API_KEY", "--api-key"),
+    ("LIVEKIT_API_SECRET", "--api-secret"),
+)
+_AUTOSTART_MODES = frozenset({"dispatch", "connect"})
 
-def _handle_missing_livekit(error: ImportError, config: AgentConfig) -> None:
+
+_LIVEKIT_API: Any = None
+
+
+def _livekit_api() -> Any:
+    """Import livekit.api on first use and keep the module for later calls."""
+
+    global _LIVEKIT_API
+    if _LIVEKIT_API is None:
+        from livekit import api  # type: ignore
+
+        _LIVEKIT_API = api
+    return _LIVEKIT_API
+
+
+def _env_cli_flags(env: Any) -> list[str]:
+    return [
+        arg
+        for var, flag in _ENV_CLI_FLAGS
+        if (value := env.get(var))
+        for arg in (flag, value)
+    ]
+
+
+def _handle_missing_livekit(error: Exception, config: AgentConfig) -> None:
     """
     Provide a clear message when LiveKit (or its plugins) are unavailable locally.
     This keeps the script runnable even in offline/dev environments.
@@ -35,52 +68,102 @@ def _handle_missing_livekit(error: ImportError, config: AgentConfig) -> None:
     )
 
 
-def _wait_for_room_participants(
+async def _serve_room_webhook(
+    room: str, api_key: str, api_secret: str, listen_url: str
+) -> None:
+    """
+    Serve LiveKit webhooks on ``listen_url`` (e.g. http://0.0.0.0:8088/livekit)
+    and return once a signed ``participant_joined`` event for ``room`` arrives.
+    """
+
+    from aiohttp import web  # type: ignore
+
+    api = _livekit_api()
+    receiver = api.WebhookReceiver(api.TokenVerifier(api_key, api_secret))
+    joined = asyncio.Event()
+
+    async def _handle(request: Any) -> Any:
+        body = await request.text()
+        try:
+            event = receiver.receive(body, request.headers.get("Authorization", ""))
+        except Exception:
+            return web.Response(status=401)
+        if event.event == "participant_joined" and event.room.name == room:
+            joined.set()
+        return web.Response()
+
+    parsed = urlparse(listen_url)
+    app = web.Application()
+    app.router.add_post(parsed.path or "/", _handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, parsed.hostname or "0.0.0.0", parsed.port or 8088).start()
+        await joined.wait()
+    finally:
+        await runner.cleanup()
+
+
+async def _await_room_participants(
     room: str,
     url: str,
     api_key: str,
     api_secret: str,
+    *,
+    poll_seconds: float,
+    timeout_seconds: float,
+    poll_max_seconds: Optional[float] = None,
+    webhook_listen: Optional[str] = None,
 ) -> None:
     """
     Poll the LiveKit RoomService until the target room has at least one
-    participant. This prevents the agent from being the first joiner/host.
+    participant. Usable from any running loop with its own LiveKitAPI client.
+    With ``webhook_listen`` a participant_joined webhook also ends the wait,
+    without waiting for the next poll; polling alone remains the fallback if
+    the listener cannot start.
     """
 
-    poll_seconds = float(os.getenv("VOICE_AGENT_POLL_SECONDS", "2.0"))
-    timeout_seconds = float(os.getenv("VOICE_AGENT_WAIT_TIMEOUT", "0"))
-
-    async def _wait_loop() -> None:
-        from livekit import api  # type: ignore
-
-        start = asyncio.get_running_loop().time()
-        attempt = 0
+    api = _livekit_api()
+
+    start = time.monotonic()
+    attempt = 0
+    # Poll every poll_seconds at first and back off exponentially towards
+    # poll_max_seconds, so a room that stays empty for minutes costs a handful of
+    # requests. A cap at or below poll_seconds keeps a fixed interval.
+    initial_delay = poll_seconds
+    max_delay = max(poll_seconds, poll_max_seconds or poll_seconds)
+    delay = initial_delay
+    # ListRooms filtered by name reports num_participants without shipping the
+    # participant list; a room that does not exist yet simply comes back empty.
+    request = api.ListRoomsRequest(names=[room])
+    webhook_task: Optional[asyncio.Task[None]] = None
+    if webhook_listen:
+        webhook_task = asyncio.create_task(
+            _serve_room_webhook(room, api_key, api_secret, webhook_listen)
+        )
 
+    try:
         async with api.LiveKitAPI(url=url, api_key=api_key, api_secret=api_secret) as lkapi:
             while True:
                 attempt += 1
                 try:
-                    response = await lkapi.room.list_participants(
-                        api.ListParticipantsRequest(room=room)
-                    )
-                    participants = response.participants
-                except api.TwirpError as err:
-                    if err.code == api.TwirpErrorCode.NOT_FOUND:
-                        participants = []
-                    else:
-                        raise
+                    response = await lkapi.room.list_rooms(request)
+                except (OSError, asyncio.TimeoutError) as exc:
+                    # Transient network trouble: retry soon instead of waiting a long back-off.
+                    print(f"[voice-agent] Room lookup failed ({exc}); retrying.", file=sys.stderr)
+                    participants = 0
+                    delay = initial_delay
+                else:
+                    participants = sum(info.num_participants for info in response.rooms)
 
                 if participants:
-                    identities = ", ".join(
-                        participant.identity or participant.name or "<unknown>"
-                        for participant in participants
-                    )
                     print(
-                        f"[voice-agent] Room '{room}' has active participants ({identities}); connecting.",
+                        f"[voice-agent] Room '{room}' has {participants} active participant(s); connecting.",
                         file=sys.stderr,
                     )
                     return
 
-                elapsed = asyncio.get_running_loop().time() - start
+                elapsed = time.monotonic() - start
                 if timeout_seconds and elapsed > timeout_seconds:
                     raise TimeoutError(
                         f"Timed out after {timeout_seconds}s waiting for participants in room '{room}'."
@@ -91,117 +174,161 @@ def _wait_for_room_participants(
                         f"[voice-agent] Waiting for participants in room '{room}' before connecting...",
                         file=sys.stderr,
                     )
-                await asyncio.sleep(poll_seconds)
+                # Never sleep past the configured timeout; poll once more at the deadline.
+                sleep_for = min(delay, timeout_seconds - elapsed) if timeout_seconds else delay
+                delay = min(delay * 1.5, max_delay)
+                if webhook_task is None:
+                    await asyncio.sleep(sleep_for)
+                    continue
+                done, _ = await asyncio.wait({webhook_task}, timeout=sleep_for)
+                if not done:
+                    continue
+                error = webhook_task.exception()
+                webhook_task = None
+                if error is None:
+                    print(
+                        f"[voice-agent] Participant joined room '{room}' (webhook); connecting.",
+                        file=sys.stderr,
+                    )
+                    return
+                print(
+                    f"[voice-agent] Webhook listener stopped ({error!r}); polling only.",
+                    file=sys.stderr,
+                )
+    finally:
+        if webhook_task is not None:
+            webhook_task.cancel()
+            try:
+                await webhook_task
+            except (asyncio.CancelledError, Exception):
+                pass
 
-    asyncio.run(_wait_loop())
 
+def _wait_for_room_participants(
+    room: str,
+    url: str,
+    api_key: str,
+    api_secret: str,
+) -> None:
+    """
+    Block until the target room has at least one participant. This prevents
+    the agent from being the first joiner/host. cli.run_app creates its own
+    loop only after argv is final, so this pre-run check gets a short-lived one.
+    """
 
-def _apply_env_cli_defaults() -> None:
+    try:
+        import uvloop  # type: ignore
+    except ImportError:  # pragma: no cover - optional dependency
+        run = asyncio.run
+    else:
+        # Scoped to this loop only; no global policy for cli.run_app to inherit.
+        run = uvloop.run
+
+    env = os.environ
+    run(
+        _await_room_participants(
+            room,
+            url,
+            api_key,
+            api_secret,
+            poll_seconds=float(env.get("VOICE_AGENT_POLL_SECONDS", "2.0")),
+            poll_max_seconds=float(env.get("VOICE_AGENT_POLL_MAX_SECONDS", "30.0")),
+            timeout_seconds=float(env.get("VOICE_AGENT_WAIT_TIMEOUT", "0")),
+            webhook_listen=env.get("VOICE_AGENT_WEBHOOK_LISTEN", "").strip() or None,
+        )
+    )
+
+
+def _flush_stderr(messages: list[str]) -> None:
+    """Write the queued startup notices in one call."""
+
+    if messages:
+        sys.stderr.write("\n".join(messages) + "\n")
+        messages.clear()
+
+
+def _apply_env_cli_defaults(before_wait: Optional[Callable[[], object]] = None) -> None:
     """
     Allow a shorthand mode where the developer only sets env vars and runs
     `python main.py` without passing CLI args. When VOICE_AGENT_ROOM is set, we
     pivot to the `connect` command with env-provided defaults. Optionally wait
-    until the room is already occupied so the agent does not become the host.
+    until the room is already occupied so the agent does not become the host;
+    ``before_wait`` runs first, before the wait touches LiveKit.
     """
 
     if len(sys.argv) > 1:
         return
 
+    env = os.environ
+    messages: list[str] = []
     autostart_mode = (
-        os.getenv("VOICE_AGENT_AUTOSTART_MODE", "dispatch").strip().lower() or "dispatch"
+        env.get("VOICE_AGENT_AUTOSTART_MODE", "dispatch").strip().lower() or "dispatch"
     )
-    if autostart_mode not in {"dispatch", "connect"}:
-        print(
-            f"[voice-agent] Unknown VOICE_AGENT_AUTOSTART_MODE '{autostart_mode}', falling back to dispatch.",
-            file=sys.stderr,
+    if autostart_mode not in _AUTOSTART_MODES:
+        messages.append(
+            f"[voice-agent] Unknown VOICE_AGENT_AUTOSTART_MODE '{autostart_mode}', falling back to dispatch."
         )
         autostart_mode = "dispatch"
 
-    room = os.getenv("VOICE_AGENT_ROOM")
-    url = os.getenv("LIVEKIT_URL")
-    api_key = os.getenv("LIVEKIT_API_KEY")
-    api_secret = os.getenv("LIVEKIT_API_SECRET")
-    watch_flag = os.getenv("VOICE_AGENT_WATCH", "").strip().lower()
+    room = env.get("VOICE_AGENT_ROOM")
+    if autostart_mode == "connect" and not room:
+        messages.append("[voice-agent] VOICE_AGENT_AUTOSTART_MODE=connect requires VOICE_AGENT_ROOM.")
+        _flush_stderr(messages)
+        return
+
+    # An empty VOICE_AGENT_WATCH keeps watching on.
+    watch = _env_bool("VOICE_AGENT_WATCH", True, empty_is_default=True)
+    watch_args = () if watch else ("--no-watch",)
 
     if autostart_mode == "connect":
-        if not room:
-            print(
-                "[voice-agent] VOICE_AGENT_AUTOSTART_MODE=connect requires VOICE_AGENT_ROOM.",
-                file=sys.stderr,
-            )
-            return
-
-        cli_args = ["connect", "--room", room]
-        if url:
-            cli_args.extend(["--url", url])
-        if api_key:
-            cli_args.extend(["--api-key", api_key])
-        if api_secret:
-            cli_args.extend(["--api-secret", api_secret])
-        if watch_flag in {"0", "false", "no"}:
-            cli_args.append("--no-watch")
-
-        wait_for_occupant = os.getenv("VOICE_AGENT_WAIT_FOR_OCCUPANT", "true").strip().lower() not in {
-            "",
-            "0",
-            "false",
-            "no",
-        }
+        cli_args = ["connect", "--room", room, *_env_cli_flags(env), *watch_args]
+
+        wait_for_occupant = _env_bool("VOICE_AGENT_WAIT_FOR_OCCUPANT", True)
         if wait_for_occupant:
+            # Only the occupancy check needs the credentials themselves.
+            url = env.get("LIVEKIT_URL")
+            api_key = env.get("LIVEKIT_API_KEY")
+            api_secret = env.get("LIVEKIT_API_SECRET")
             if not (url and api_key and api_secret):
-                print(
+                messages.append(
                     "[voice-agent] VOICE_AGENT_WAIT_FOR_OCCUPANT is enabled but LIVEKIT_URL/API_KEY/API_SECRET "
-                    "are missing. Skipping occupancy check.",
-                    file=sys.stderr,
+                    "are missing. Skipping occupancy check."
                 )
             else:
+                # The wait can take minutes; show what is queued before blocking.
+                _flush_stderr(messages)
+                if before_wait is not None:
+                    before_wait()
                 try:
                     _wait_for_room_participants(room, url, api_key, api_secret)
                 except Exception as exc:  # pragma: no cover - best effort guard
-                    print(
-                        f"[voice-agent] Failed to wait for room occupants: {exc}. Continuing without guard.",
-                        file=sys.stderr,
+                    messages.append(
+                        f"[voice-agent] Failed to wait for room occupants: {exc}. Continuing without guard."
                     )
 
-        print(
-            f"[voice-agent] VOICE_AGENT_ROOM detected. Defaulting to `python main.py {' '.join(cli_args)}`.",
-            file=sys.stderr,
+        messages.append(
+            f"[voice-agent] VOICE_AGENT_ROOM detected. Defaulting to `python main.py {' '.join(cli_args)}`."
         )
+        _flush_stderr(messages)
         sys.argv.extend(cli_args)
         return
 
     # dispatch mode (default)
-    cli_args = ["dev"]
-    if watch_flag in {"0", "false", "no"}:
-        cli_args.append("--no-watch")
-    if url:
-        cli_args.extend(["--url", url])
-    if api_key:
-        cli_args.extend(["--api-key", api_key])
-    if api_secret:
-        cli_args.extend(["--api-secret", api_secret])
+    cli_args = ["dev", *watch_args, *_env_cli_flags(env)]
 
     if room:
-        print(
-            f"[voice-agent] Dispatch mode enabled. Waiting for AgentDispatch requests targeting room '{room}'.",
-            file=sys.stderr,
+        messages.append(
+            f"[voice-agent] Dispatch mode enabled. Waiting for AgentDispatch requests targeting room '{room}'."
         )
     else:
-        print(
-            "[voice-agent] Dispatch mode enabled. Waiting for AgentDispatch requests.",
-            file=sys.stderr,
-        )
-    print(
-        f"[voice-agent] Defaulting to `python main.py {' '.join(cli_args)}`.",
-        file=sys.stderr,
-    )
+        messages.append("[voice-agent] Dispatch mode enabled. Waiting for AgentDispatch requests.")
+    messages.append(f"[voice-agent] Defaulting to `python main.py {' '.join(cli_args)}`.")
+    _flush_stderr(messages)
     sys.argv.extend(cli_args)
 
 
 def run_cli() -> None:
     load_dotenv()
-    config = load_config()
-
     bootstrap_compat()
 
     root_dir = str(Path(__file__).resolve().parents[1])
@@ -210,11 +337,27 @@ def run_cli() -> None:
     if root_dir not in paths:
         paths.insert(0, root_dir)
         os.environ["PYTHONPATH"] = os.pathsep.join(paths)
-
-    _apply_env_cli_defaults()
-
-    if LIVEKIT_IMPORT_ERROR is not None:
-        _handle_missing_livekit(LIVEKIT_IMPORT_ERROR, config)
+    # Worker subprocesses inherit this and apply the compat patches via sitecustomize.
+    os.environ.setdefault("VOICE_AGENT_BOOTSTRAP", "1")
+
+    # Importing the LiveKit tree is the slowest startup step; start it while the
+    # env-driven CLI setup runs. Dotenv and the compat hooks above must be in place
+    # first. The room-occupancy wait imports livekit.api itself, so it waits for the
+    # background import to finish rather than importing the same package concurrently.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="voice-agent-import"
+    ) as executor:
+        livekit_import = executor.submit(_import_livekit)
+        _apply_env_cli_defaults(
+            before_wait=lambda: concurrent.futures.wait((livekit_import,))
+        )
+        try:
+            livekit_import_error: Optional[Exception] = livekit_import.result()
+        except Exception as exc:
+            # Anything but ImportError escapes _import_livekit; report it the same way.
+            livekit_import_error = exc
+    if livekit_import_error is not None:
+        _handle_missing_livekit(livekit_import_error, load_config())
         return
 
     from livekit.agents import WorkerOptions, cli  # type: ignore
@@ -222,7 +365,7 @@ def run_cli() -> None:
     cli.run_app(
         WorkerOptions(
             entrypoint_fnc=run_job,
-            agent_name=config.agent_name,
+            agent_name=resolve_agent_name(),
             initialize_process_timeout=float(os.getenv("VOICE_AGENT_INIT_TIMEOUT", "15")),
         )
     )
@@ -1,6 +1,83 @@
-import inspect
+import functools
 import logging
-from typing import Any
+import os
+import sys
+from typing import Any, Callable, Optional
+
+
+_LK_LOGGER = logging.getLogger("voice-agent.livekit")
+_GEMINI_LOGGER = logging.getLogger("voice-agent.gemini")
+
+_DEFERRED_PATCHES: dict[str, Callable[[Any], None]] = {}
+_BOOTSTRAPPED = False
+
+
+class _PatchingLoader:
+    """Delegate to the real loader and run the deferred patch once the module executed."""
+
+    def __init__(self, loader: Any, patch: Callable[[Any], None]) -> None:
+        self._loader = loader
+        self._patch = patch
+
+    def create_module(self, spec: Any) -> Any:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: Any) -> None:
+        self._loader.exec_module(module)
+        self._patch(module)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class _PatchOnImportFinder:
+    """
+    ``sys.meta_path`` hook that wraps the loader of modules with a pending patch.
+    Lets bootstrap() run in every interpreter (via sitecustomize) without
+    importing aiohttp or LiveKit up front.
+    """
+
+    def find_spec(self, fullname: str, path: Any, target: Any = None) -> Any:
+        patch = _DEFERRED_PATCHES.get(fullname)
+        if patch is None:
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        # run_cli may import LiveKit on a worker thread; claim the patch atomically.
+        if _DEFERRED_PATCHES.pop(fullname, None) is None:
+            return spec
+        spec.loader = _PatchingLoader(spec.loader, patch)
+        return spec
+
+
+_IMPORT_HOOK = _PatchOnImportFinder()
+
+
+def _patch_when_imported(module_name: str, patch: Callable[[Any], None]) -> None:
+    """Apply ``patch`` now if ``module_name`` is loaded, otherwise on its first import."""
+
+    module = sys.modules.get(module_name)
+    if module is not None:
+        _DEFERRED_PATCHES.pop(module_name, None)
+        patch(module)
+        return
+
+    _DEFERRED_PATCHES[module_name] = patch
+    if _IMPORT_HOOK not in sys.meta_path:
+        sys.meta_path.insert(0, _IMPORT_HOOK)
 
 
 def _ensure_importlib_compat() -> None:
@@ -8,12 +85,10 @@ def _ensure_importlib_compat() -> None:
     google.api_core expects importlib.metadata.packages_distributions which is
     only available in the stdlib starting with Python 3.10. When running on
     Python 3.9 we mirror the backport implementation to avoid runtime errors.
+    Only called on interpreters older than 3.10.
     """
 
-    try:
-        import importlib.metadata as stdlib_metadata  # type: ignore
-    except ImportError:  # pragma: no cover - older interpreters
-        return
+    import importlib.metadata as stdlib_metadata  # type: ignore
 
     try:
         import importlib_metadata as backport  # type: ignore
@@ -23,11 +98,21 @@ def _ensure_importlib_compat() -> None:
     if not hasattr(stdlib_metadata, "packages_distributions") and hasattr(
         backport, "packages_distributions"
     ):
+        # The backport rescans every sys.path entry on each call; the result only
+        # changes when packages are installed, so compute it once per process.
+        # Callers get a shallow copy so one mutating it cannot corrupt the rest.
+        scan = functools.lru_cache(maxsize=1)(backport.packages_distributions)
+
+        @functools.wraps(backport.packages_distributions)
+        def cached() -> Any:
+            return dict(scan())
+
         setattr(
             stdlib_metadata,
             "packages_distributions",
-            backport.packages_distributions,
+            cached,
         )  # type: ignore[attr-defined]
+        backport.packages_distributions = cached  # type: ignore[assignment]
 
 
 def _patch_aiohttp_proxy_kwarg() -> None:
@@ -36,38 +121,67 @@ def _patch_aiohttp_proxy_kwarg() -> None:
     ``proxy=`` keyword (aiohttp 3.10+). Patch the ctor to ignore that keyword.
     """
 
-    try:
-        import aiohttp  # type: ignore
-    except ImportError:  # pragma: no cover
-        return
+    _patch_when_imported("aiohttp", _apply_aiohttp_proxy_kwarg)
 
-    original_init = aiohttp.ClientSession.__init__
-    signature = inspect.signature(original_init)
 
-    if "proxy" in signature.parameters:
+def _apply_aiohttp_proxy_kwarg(aiohttp: Any) -> None:
+    original_init = aiohttp.ClientSession.__init__
+    if getattr(original_init, "_voice_agent_patched", False):
+        return
+    if _accepts_keyword(original_init, "proxy"):
         return
 
+    @functools.wraps(original_init)
     def _patched_init(self, *args, **kwargs):  # type: ignore[no-untyped-def]
         kwargs.pop("proxy", None)
         return original_init(self, *args, **kwargs)
 
+    _patched_init._voice_agent_patched = True  # type: ignore[attr-defined]
     aiohttp.ClientSession.__init__ = _patched_init  # type: ignore[assignment]
 
 
+def _accepts_keyword(func: Any, name: str) -> bool:
+    """
+    Check for a named parameter without importing ``inspect`` in the common
+    case: plain Python functions expose their parameter names on __code__.
+    """
+
+    code = getattr(func, "__code__", None)
+    if code is not None:
+        return name in code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+
+    import inspect  # compiled/wrapped callables only
+
+    try:
+        return name in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
 def _patch_livekit_room_event() -> None:
     """
     Work around a race in livekit-rtc where local track events may arrive before
     the publication map is populated. Skip known-bad events instead of raising.
     """
 
-    try:
-        from livekit.rtc import room as rtc_room  # type: ignore
-    except ImportError:  # pragma: no cover
+    _patch_when_imported("livekit.rtc.room", _apply_livekit_room_event)
+
+
+def _apply_livekit_room_event(rtc_room: Any) -> None:
+    if getattr(rtc_room.Room, "_voice_agent_patched", False):
+        return
+    # Read when livekit.rtc is imported (after .env is loaded), not at bootstrap; config
+    # is imported here too, so sitecustomize's bootstrap stays free of it.
+    from .config import _FALSEY
+
+    flag = os.getenv("VOICE_AGENT_PATCH_ROOM_EVENTS", "").strip().lower()
+    # Unset or empty keeps the patch on.
+    if flag and flag in _FALSEY:
         return
 
     original = rtc_room.Room._on_room_event
-    logger = logging.getLogger("voice-agent.livekit")
 
+    @functools.wraps(original)
     def _patched(self, event):  # type: ignore[no-untyped-def]
         try:
             return original(self, event)
@@ -75,7 +189,7 @@ def _patch_livekit_room_event() -> None:
             which = event.WhichOneof("message")
             if which in {"local_track_published", "local_track_subscribed"}:
                 sid = getattr(getattr(event, which), "track_sid", "<unknown>")
-                logger.warning(
+                _LK_LOGGER.warning(
                     "Skipped LiveKit event %s for missing local track %s",
                     which,
                     sid,
@@ -84,6 +198,7 @@ def _patch_livekit_room_event() -> None:
             raise
 
     rtc_room.Room._on_room_event = _patched  # type: ignore[assignment]
+    rtc_room.Room._voice_agent_patched = True  # type: ignore[attr-defined]
 
 
 def _patch_google_realtime_autostart() -> None:
@@ -93,11 +208,12 @@ def _patch_google_realtime_autostart() -> None:
     does not get stuck waiting for a response.
     """
 
-    try:
-        from livekit.plugins.google.realtime import realtime_api  # type: ignore
-    except ImportError:  # pragma: no cover - plugin not available locally
-        return
+    _patch_when_imported(
+        "livekit.plugins.google.realtime.realtime_api", _apply_google_realtime_autostart
+    )
+
 
+def _apply_google_realtime_autostart(realtime_api: Any) -> None:
     original = getattr(realtime_api.RealtimeSession, "_handle_server_content", None)
     if original is None:
         return
@@ -106,13 +222,13 @@ def _patch_google_realtime_autostart() -> None:
 
     def _has_content(server_content: Any) -> bool:
         model_turn = getattr(server_content, "model_turn", None)
-        if model_turn and getattr(model_turn, "parts", None):
-            for part in model_turn.parts:
-                if getattr(part, "text", None):
-                    return True
-                inline = getattr(part, "inline_data", None)
-                if inline and getattr(inline, "data", None):
-                    return True
+        parts = getattr(model_turn, "parts", None) if model_turn else None
+        if parts and any(
+            getattr(part, "text", None)
+            or getattr(getattr(part, "inline_data", None), "data", None)
+            for part in parts
+        ):
+            return True
         output_transcription = getattr(server_content, "output_transcription", None)
         if output_transcription and getattr(output_transcription, "text", None):
             return True
@@ -121,26 +237,26 @@ def _patch_google_realtime_autostart() -> None:
             return True
         return False
 
-    logger = logging.getLogger("voice-agent.gemini")
-
+    # Runs for every server_content chunk Gemini streams, so each attribute is read
+    # once per phase and _has_content is evaluated at most once per call.
+    @functools.wraps(original)
     def _patched(self, server_content):  # type: ignore[no-untyped-def]
+        has_content: Optional[bool] = None
         try:
-            needs_generation = (
-                getattr(self, "_current_generation", None) is None
-                or getattr(getattr(self, "_current_generation", None), "_done", False)
-            )
-            if needs_generation:
+            current = getattr(self, "_current_generation", None)
+            if current is None or getattr(current, "_done", False):
                 try:
                     setattr(self, "_current_generation_event", None)
                     self._start_new_generation()  # type: ignore[attr-defined]
-                    if _has_content(server_content):
-                        logger.debug(
+                    has_content = _has_content(server_content)
+                    if has_content:
+                        _GEMINI_LOGGER.debug(
                             "Gemini autostart: primed generation before server content."
                         )
                 except Exception as exc:  # pragma: no cover - best effort guard
-                    logger.warning("Failed to auto-start Gemini generation: %s", exc)
+                    _GEMINI_LOGGER.warning("Failed to auto-start Gemini generation: %s", exc)
         except Exception:  # pragma: no cover - defensive
-            logger.debug(
+            _GEMINI_LOGGER.debug(
                 "Gemini realtime autostart probe failed; continuing with original handler."
             )
 
@@ -148,15 +264,16 @@ def _patch_google_realtime_autostart() -> None:
 
         try:
             pending = getattr(self, "_pending_generation_fut", None)
+            if pending is None or pending.done():
+                return result
+            # The original handler may have swapped the generation; read it afresh.
             current = getattr(self, "_current_generation", None)
-            if (
-                pending is not None
-                and not pending.done()
-                and current is not None
-                and getattr(current, "message_ch", None) is not None
-            ):
-                if _has_content(server_content):
-                    logger.debug(
+            message_ch = getattr(current, "message_ch", None)
+            if message_ch is not None:
+                if has_content is None:
+                    has_content = _has_content(server_content)
+                if has_content:
+                    _GEMINI_LOGGER.debug(
                         "Gemini autostart: resolving pending generation after content."
                     )
                     try:
@@ -167,7 +284,7 @@ def _patch_google_realtime_autostart() -> None:
                             from livekit.agents import llm as _llm  # type: ignore
 
                             event = _llm.GenerationCreatedEvent(
-                                message_stream=current.message_ch,
+                                message_stream=message_ch,
                                 function_stream=current.function_ch,
                                 user_initiated=True,
                                 response_id=response_id,
@@ -176,9 +293,9 @@ def _patch_google_realtime_autostart() -> None:
                         pending.set_result(event)
                         setattr(self, "_pending_generation_fut", None)
                     except Exception as exc:  # pragma: no cover
-                        logger.warning("Gemini autostart fallback failed: %s", exc)
+                        _GEMINI_LOGGER.warning("Gemini autostart fallback failed: %s", exc)
         except Exception:  # pragma: no cover
-            logger.debug("Gemini autostart post-hook failed.")
+            _GEMINI_LOGGER.debug("Gemini autostart post-hook failed.")
 
         return result
 
@@ -190,9 +307,18 @@ def bootstrap() -> None:
     """
     Apply all runtime compatibility patches needed for the agent to function.
     Separated into a dedicated call so imports remain side-effect free for tests.
+    Third-party patches are applied when their target module is first imported.
+    Runs once per process; sitecustomize, run_cli and run_job may all call it.
     """
 
-    _ensure_importlib_compat()
+    global _BOOTSTRAPPED
+    if _BOOTSTRAPPED:
+        return
+    _BOOTSTRAPPED = True
+
+    if sys.version_info < (3, 10):
+        # 3.10+ ships packages_distributions; skip importing importlib.metadata.
+        _ensure_importlib_compat()
     _patch_aiohttp_proxy_kwarg()
     _patch_livekit_room_event()
     _patch_google_realtime_autostart()
@@ -1,9 +1,10 @@
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from .resources import read_instructions
+from .resources import _read_prompt, read_instructions
 from .tools import rss
 
 
@@ -22,17 +23,36 @@ def load_dotenv() -> None:
     _load_dotenv()
 
 
+# The one spelling of a "disabled" env/metadata value. _is_truthy uses it as is;
+# the env flags read through _env_bool have never treated "off" as disabled.
+_FALSEY = frozenset(("", "0", "false", "no", "off"))
+_ENV_FALSEY = _FALSEY - {"off"}
+
+
 def _is_truthy(value) -> bool:
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, (int, float)):
-        return value != 0
-    if isinstance(value, str):
-        return value.strip().lower() not in {"", "0", "false", "no", "off"}
+    # Env values and job metadata are almost always str; bool(value) covers the
+    # bool/int/float cases the same way the explicit checks used to.
+    if type(value) is str:
+        return value.strip().lower() not in _FALSEY
     return bool(value)
 
 
-@dataclass
+def _env_bool(name: str, default: bool = True, *, empty_is_default: bool = False) -> bool:
+    """
+    Read an on/off env flag; unset keeps the default, 0, false, no disable it.
+    An empty value disables it too, unless ``empty_is_default`` is set.
+    """
+
+    value = os.getenv(name)
+    if value is None:
+        return default
+    value = value.strip().lower()
+    if empty_is_default and not value:
+        return default
+    return value not in _ENV_FALSEY
+
+
+@dataclass(slots=True, frozen=True)
 class AgentConfig:
     instructions: str
     agent_name: str
@@ -42,32 +62,103 @@ class AgentConfig:
     enable_search: bool = False
 
 
+_CONFIG_ENV_VARS = (
+    "VOICE_AGENT_INSTRUCTIONS",
+    "VOICE_AGENT_PROMPT_FILE",
+    "VOICE_AGENT_NAME",
+    "GEMINI_MODEL",
+    "GEMINI_TTS_VOICE",
+    "GEMINI_TEMPERATURE",
+    "GEMINI_ENABLE_SEARCH",
+    rss._CATALOG_ENV_VAR,
+)
+
+
+def _normalize_agent_name(raw: Optional[str]) -> str:
+    return (raw or "Hanna").strip() or "Hanna"
+
+
+def resolve_agent_name() -> str:
+    """Worker/agent name used for dispatch; cheap to call without loading the prompt."""
+
+    return _normalize_agent_name(os.environ.get("VOICE_AGENT_NAME"))
+
+
+def _prompt_path(prompt_file: Optional[str]) -> Path:
+    return Path(prompt_file if prompt_file is not None else "prompt.md")
+
+
 def load_config() -> AgentConfig:
-    instructions = os.getenv("VOICE_AGENT_INSTRUCTIONS")
+    """
+    Build the agent config from the environment and prompt file. The result is
+    memoised on the values of _CONFIG_ENV_VARS plus the prompt file's mtime, so
+    repeated calls (one per worker job) are cheap but prompt edits are picked up.
+    """
+
+    env = os.environ
+    env_values = tuple(env.get(name) for name in _CONFIG_ENV_VARS)
+    prompt_mtime_ns: Optional[int] = None
+    if not env_values[0]:
+        try:
+            prompt_mtime_ns = _prompt_path(env_values[1]).stat().st_mtime_ns
+        except OSError:
+            prompt_mtime_ns = None
+    return _load_config_cached(env_values, prompt_mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached(
+    env_values: tuple[Optional[str], ...], _prompt_mtime_ns: Optional[int]
+) -> AgentConfig:
+    (
+        instructions,
+        prompt_file,
+        agent_name,
+        model,
+        voice,
+        temperature,
+        search_flag,
+        _catalog_file,
+    ) = env_values
 
     if not instructions:
-        prompt_path = Path(os.getenv("VOICE_AGENT_PROMPT_FILE", "prompt.md"))
-        instructions = read_instructions(prompt_path)
+        instructions = read_instructions(_prompt_path(prompt_file))
 
     instructions = _append_rss_catalog_section(instructions)
 
-    search_flag = os.getenv("GEMINI_ENABLE_SEARCH")
-
     return AgentConfig(
         instructions=instructions,
-        agent_name=os.getenv("VOICE_AGENT_NAME", "Hanna").strip() or "Hanna",
-        model=os.getenv(
-            "GEMINI_MODEL", "gemini-2.5-flash-native-audio-preview-09-2025"
-        ),
-        voice=os.getenv("GEMINI_TTS_VOICE", ""),
-        temperature=float(os.getenv("GEMINI_TEMPERATURE", 0.8)),
+        agent_name=_normalize_agent_name(agent_name),
+        model=model if model is not None else "gemini-2.5-flash-native-audio-preview-09-2025",
+        voice=voice if voice is not None else "",
+        temperature=float(temperature if temperature is not None else 0.8),
         enable_search=_is_truthy(search_flag) if search_flag is not None else False,
     )
 
 
+def reload_config() -> AgentConfig:
+    """
+    Drop every memoised config value and rebuild: the config itself, the voice
+    fallback, the prompt text, and the Gemini key and video sampler rates the
+    session derives from the environment. Tool settings are not reloaded.
+    """
+
+    # runtime.session imports this module; import it here to avoid the cycle.
+    from .runtime import session
+
+    _load_config_cached.cache_clear()
+    _resolve_voice_override.cache_clear()
+    _read_prompt.cache_clear()
+    session._resolve_gemini_api_key.cache_clear()
+    session._video_sampler_fps.cache_clear()
+    return load_config()
+
+
+@functools.lru_cache(maxsize=4)
 def _resolve_voice_override(default: Optional[str] = None) -> str:
     """
     Provide a final fallback when neither the environment nor job metadata specify a voice.
+    GEMINI_TTS_VOICE_DEFAULT is read once per process; reload_config() resets it.
     """
 
     override = os.getenv("GEMINI_TTS_VOICE_DEFAULT") or ""
@@ -1,14 +1,25 @@
+import functools
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=4)
+def _read_prompt(path: Path, _mtime_ns: int) -> str:
+    with open(path, "rb") as handle:
+        data = handle.read()
+    # Binary read skips the text-IO layer; keep its universal-newline translation
+    # (CRLF and lone CR both become LF).
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
 def read_instructions(path: Path) -> str:
     """
     Load the assistant instructions from `prompt.md` or an alternative path.
+    The file is re-read only when its modification time changes.
     Raises RuntimeError with context if the file is missing.
     """
 
     try:
-        return path.read_text(encoding="utf-8").strip()
+        return _read_prompt(path, path.stat().st_mtime_ns)
     except FileNotFoundError as exc:
         raise RuntimeError(
             f"Prompt file '{path}' is missing. Provide VOICE_AGENT_PROMPT_FILE or VOICE_AGENT_INSTRUCTIONS."
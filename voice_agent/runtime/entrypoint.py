@@ -1,13 +1,11 @@
 import json
 import logging
 import os
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-from livekit import rtc
-from ..agent import GeminiVisionAgent, LIVEKIT_IMPORT_ERROR
-from ..config import AgentConfig, load_config, _is_truthy
+from ..agent import _build_agent_class, _import_livekit
+from ..config import AgentConfig, load_config, _env_bool, _is_truthy
 from ..compat import bootstrap as bootstrap_compat
-from .events import ParticipantGreeter
 from .session import (
     SessionArtifacts,
     SessionSettings,
@@ -17,15 +15,22 @@ from .session import (
     _resolve_gemini_api_key,
 )
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .events import ParticipantGreeter
+
 _VIDEO_LOGGER = logging.getLogger("voice-agent.video")
 
 
 def _load_job_metadata(ctx: Any) -> dict[str, Any]:
-    job_metadata_raw = getattr(ctx.job, "metadata", "") or "{}"
+    job_metadata_raw = getattr(ctx.job, "metadata", "")
+    # Most dispatches carry no overrides; skip the parser for them.
+    if not job_metadata_raw or job_metadata_raw == "{}":
+        return {}
     try:
-        return json.loads(job_metadata_raw)
+        job_metadata = json.loads(job_metadata_raw)
     except json.JSONDecodeError:
         return {}
+    return job_metadata if isinstance(job_metadata, dict) else {}
 
 
 def _determine_room(ctx: Any, job_metadata: dict[str, Any]) -> str:
@@ -38,18 +43,13 @@ def _determine_room(ctx: Any, job_metadata: dict[str, Any]) -> str:
 
 
 def _compute_env_managed_rooms() -> set[str]:
-    default_room = os.getenv("VOICE_AGENT_DEFAULT_ROOM", "").strip()
-    demo_room = os.getenv("VOICE_AGENT_DEMO_ROOM", "").strip()
-    return {
-        value.casefold()
-        for value in (default_room, demo_room)
-        if isinstance(value, str) and value.strip()
-    }
+    default_room = os.getenv("VOICE_AGENT_DEFAULT_ROOM", "").strip().casefold()
+    demo_room = os.getenv("VOICE_AGENT_DEMO_ROOM", "").strip().casefold()
+    return {room for room in (default_room, demo_room) if room}
 
 
 def _resolve_broadcast_mode(job_metadata: dict[str, Any]) -> bool:
-    broadcast_default = os.getenv("VOICE_AGENT_MULTI_PARTICIPANT", "false").strip().lower()
-    broadcast_mode = broadcast_default not in {"", "0", "false", "no"}
+    broadcast_mode = _env_bool("VOICE_AGENT_MULTI_PARTICIPANT", False)
     if "multi_participant" in job_metadata:
         broadcast_mode = bool(job_metadata.get("multi_participant"))
     return broadcast_mode
@@ -107,7 +107,9 @@ def _create_participant_greeter(
     close_room_on_empty: bool,
     shutdown_delay: float,
     greeting_delay: float,
-) -> Optional[ParticipantGreeter]:
+) -> Optional["ParticipantGreeter"]:
+    from .events import ParticipantGreeter
+
     room_io = getattr(session_artifacts.session, "_room_io", None)
     if room_io is None:
         return None
@@ -145,10 +147,11 @@ def _create_participant_greeter(
 
 
 async def run_job(ctx: Any) -> None:
-    if LIVEKIT_IMPORT_ERROR is not None:
+    livekit_import_error = _import_livekit()
+    if livekit_import_error is not None:
         raise RuntimeError(
             "LiveKit agents are not available; fallback handler should have run instead."
-        ) from LIVEKIT_IMPORT_ERROR
+        ) from livekit_import_error
 
     bootstrap_compat()
 
@@ -167,7 +170,8 @@ async def run_job(ctx: Any) -> None:
     )
 
     session_artifacts = build_agent_session(settings)
-    agent = GeminiVisionAgent(instructions=settings.instructions)
+    agent_cls = _build_agent_class()
+    agent = agent_cls(instructions=settings.instructions)
 
     await session_artifacts.session.start(
         agent=agent,
@@ -2,6 +2,8 @@ import asyncio
 import contextlib
 import logging
 import os
+import time
+from collections import OrderedDict
 from typing import Any, Optional
 
 _VIDEO_LOGGER = logging.getLogger("voice-agent.video")
@@ -16,6 +18,16 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     _lk_rtc = None  # type: ignore[assignment]
 
+if _lk_rtc is not None:
+    _DEFAULT_ALLOWED_KINDS: frozenset[Any] = frozenset(
+        {
+            getattr(_lk_rtc.ParticipantKind, "PARTICIPANT_KIND_STANDARD", None),
+            getattr(_lk_rtc.ParticipantKind, "PARTICIPANT_KIND_SIP", None),
+        }
+    )
+else:  # pragma: no cover - fallback when livekit missing
+    _DEFAULT_ALLOWED_KINDS = frozenset()
+
 try:
     from livekit.agents.types import ATTRIBUTE_PUBLISH_ON_BEHALF
 except ImportError:  # pragma: no cover - fallback when livekit missing
@@ -27,6 +39,13 @@ except ImportError:  # pragma: no cover - used only when realtime is available
     RealtimeError = Exception  # type: ignore[assignment]
 
 
+# Pause before each retry after a RealtimeError; len + 1 attempts in total.
+_GREETING_RETRY_DELAYS = (0.5, 0.5)
+# Identities greeted within this window are not greeted again on reconnect.
+_REGREET_TTL_SECONDS = 30.0
+_GREETING_HISTORY_LIMIT = 256
+
+
 class ParticipantGreeter:
     """
     Manage participant greetings and media readiness checks for the session.
@@ -51,6 +70,7 @@ class ParticipantGreeter:
         self._room_io = room_io
         self._broadcast_mode = broadcast_mode
         self._greeting_text = greeting_text
+        self._greeting_prompt = f"Say exactly: {greeting_text}"
         self._terminate_on_empty = terminate_on_empty
         self._close_room_on_empty = close_room_on_empty
         
@@ -59,15 +79,32 @@ class ParticipantGreeter:
         # Default greeting delay is minimal
         self._greeting_delay = max(0.0, greeting_delay)
         
+        configured_kinds = getattr(
+            getattr(room_io, "_input_options", None), "participant_kinds", None
+        )
+        if isinstance(configured_kinds, list) and configured_kinds:
+            self._allowed_kinds: frozenset[Any] = frozenset(configured_kinds)
+        else:
+            self._allowed_kinds = _DEFAULT_ALLOWED_KINDS
+
         self._greeted_sids: set[str] = set()
-        self._inflight_initializations: set[str] = set()
+        # identity -> monotonic time of the last greeting, oldest first.
+        self._recent_greetings: OrderedDict[str, float] = OrderedDict()
+        # sid -> identity of participants waiting for the (single) greeting task.
+        self._pending_greetings: dict[str, str] = {}
+        self._greeting_task: Optional[asyncio.Task[None]] = None
+        self._local_identity: Optional[str] = None
+        # Resolved by room events that may change RoomIO media state; see _wait_for_media_ready.
+        self._media_waiter: Optional[asyncio.Future[None]] = None
         self._participant_poll_task: Optional[asyncio.Task[Any]] = None
         self._shutdown_task: Optional[asyncio.Task[None]] = None
 
     def attach(self) -> None:
         room = self._ctx.room
+        self._local_identity = room.local_participant.identity
         room.on("participant_connected", self._handle_participant_connected)
         room.on("participant_disconnected", self._handle_participant_disconnected)
+        room.on("track_subscribed", self._handle_track_subscribed)
 
         for participant in room.remote_participants.values():
             self._handle_participant_connected(participant)
@@ -81,10 +118,16 @@ class ParticipantGreeter:
         room = self._ctx.room
         room.off("participant_connected", self._handle_participant_connected)
         room.off("participant_disconnected", self._handle_participant_disconnected)
+        room.off("track_subscribed", self._handle_track_subscribed)
         if self._participant_poll_task:
             self._participant_poll_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._participant_poll_task
+        if self._greeting_task:
+            self._greeting_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._greeting_task
+            self._greeting_task = None
         if self._shutdown_task:
             self._shutdown_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
@@ -97,11 +140,11 @@ class ParticipantGreeter:
                 await asyncio.sleep(interval)
                 participants_snapshot = list(self._ctx.room.remote_participants.values())
                 for participant in participants_snapshot:
-                    sid = getattr(participant, "sid", None)
+                    sid = participant.sid
                     if (
                         not sid
                         or sid in self._greeted_sids
-                        or sid in self._inflight_initializations
+                        or sid in self._pending_greetings
                     ):
                         continue
                     self._handle_participant_connected(participant)
@@ -111,43 +154,41 @@ class ParticipantGreeter:
             _VIDEO_LOGGER.debug("Remote participant poll failed: %s", exc)
             await asyncio.sleep(interval)
 
+    def _handle_track_subscribed(self, *_: Any) -> None:
+        self._notify_media_changed()
+
+    def _notify_media_changed(self) -> None:
+        waiter = self._media_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
     def _handle_participant_connected(self, participant: Any) -> None:
+        self._notify_media_changed()
         if self._shutdown_task:
             self._shutdown_task.cancel()
             self._shutdown_task = None
 
-        identity = getattr(participant, "identity", None)
-        sid = getattr(participant, "sid", None)
-        if identity is None or sid is None:
+        # livekit-rtc participants always expose identity/sid/attributes.
+        identity = participant.identity
+        sid = participant.sid
+        if not identity or not sid:
             return
 
-        local_identity = getattr(self._ctx.room.local_participant, "identity", None)
-        attributes = getattr(participant, "attributes", {}) or {}
-        if attributes.get(ATTRIBUTE_PUBLISH_ON_BEHALF) == local_identity:
+        if participant.attributes.get(ATTRIBUTE_PUBLISH_ON_BEHALF) == self._local_identity:
             return
 
-        if _lk_rtc is not None:
-            configured_kinds = getattr(
-                getattr(self._room_io, "_input_options", None), "participant_kinds", None
-            )
-            if isinstance(configured_kinds, list) and configured_kinds:
-                allowed_kinds = set(configured_kinds)
-            else:
-                allowed_kinds = {
-                    getattr(_lk_rtc.ParticipantKind, "PARTICIPANT_KIND_STANDARD", None),
-                    getattr(_lk_rtc.ParticipantKind, "PARTICIPANT_KIND_SIP", None),
-                }
-            participant_kind = getattr(participant, "kind", None)
-            if participant_kind not in allowed_kinds:
-                return
+        if _lk_rtc is not None and participant.kind not in self._allowed_kinds:
+            return
 
-        linked = self._room_io.linked_participant
-        target_identity = getattr(self._room_io, "_participant_identity", None)
+        room_io = self._room_io
+        linked = room_io.linked_participant
+        linked_identity = linked.identity if linked is not None else None
+        target_identity = getattr(room_io, "_participant_identity", None)
 
         should_follow = False
         if linked is None:
             should_follow = True
-        elif getattr(linked, "identity", None) == identity:
+        elif linked_identity == identity:
             should_follow = True
         elif target_identity is None:
             should_follow = True
@@ -158,11 +199,50 @@ class ParticipantGreeter:
             return
 
         if not self._broadcast_mode:
-            self._room_io.set_participant(identity)
+            room_io.set_participant(identity)
+
+        if sid in self._greeted_sids or sid in self._pending_greetings:
+            return
+        if self._recently_greeted(identity):
+            # Quick reconnect (new sid): don't repeat the greeting.
+            self._greeted_sids.add(sid)
+            return
 
-        asyncio.create_task(self._initialize_participant(identity, sid))
+        # Participants joining while a greeting is in flight share the next one
+        # instead of each spawning a task and a separate generate_reply call.
+        self._pending_greetings[sid] = identity
+        if self._greeting_task is None or self._greeting_task.done():
+            self._greeting_task = asyncio.create_task(
+                self._run_pending_greetings(), name="voice-agent.greeting"
+            )
 
-    async def _initialize_participant(self, identity: str, sid: str) -> None:
+    async def _run_pending_greetings(self) -> None:
+        while self._pending_greetings:
+            batch = dict(self._pending_greetings)
+            # Greet on behalf of the most recent joiner; the reply is heard by everyone.
+            identity = next(reversed(batch.values()))
+            try:
+                greeted = await self._initialize_participant(identity)
+            finally:
+                for sid in batch:
+                    self._pending_greetings.pop(sid, None)
+            if greeted:
+                self._greeted_sids.update(batch)
+                self._remember_greeting(batch.values())
+
+    def _recently_greeted(self, identity: str) -> bool:
+        greeted_at = self._recent_greetings.get(identity)
+        return greeted_at is not None and time.monotonic() - greeted_at < _REGREET_TTL_SECONDS
+
+    def _remember_greeting(self, identities: Any) -> None:
+        now = time.monotonic()
+        for identity in identities:
+            self._recent_greetings[identity] = now
+            self._recent_greetings.move_to_end(identity)
+        while len(self._recent_greetings) > _GREETING_HISTORY_LIMIT:
+            self._recent_greetings.popitem(last=False)
+
+    async def _initialize_participant(self, identity: str) -> bool:
         # Attempt to enable audio, but don't block
         try:
             if not self._session.input.audio_enabled:
@@ -175,22 +255,17 @@ class ParticipantGreeter:
         try:
             await self._wait_for_media_ready(identity, broadcast=self._broadcast_mode, timeout=0.5)
         except TimeoutError:
-            _VIDEO_LOGGER.info("Media not ready instantly for %s, proceeding to greet anyway.", identity)
+            if _VIDEO_LOGGER.isEnabledFor(logging.INFO):
+                _VIDEO_LOGGER.info(
+                    "Media not ready instantly for %s, proceeding to greet anyway.", identity
+                )
         except Exception:
             pass
         
-        if sid in self._greeted_sids:
-            return
-
-        self._inflight_initializations.add(sid)
-
         # Small delay to ensure connection stability
         await asyncio.sleep(1.0)
 
-        greeted = await self._send_greeting(identity)
-        if greeted:
-            self._greeted_sids.add(sid)
-        self._inflight_initializations.discard(sid)
+        return await self._send_greeting(identity)
 
     async def _wait_for_media_ready(
         self,
@@ -202,33 +277,31 @@ class ParticipantGreeter:
         loop = asyncio.get_running_loop()
         deadline = loop.time() + timeout
 
-        while True:
-            linked = self._room_io.linked_participant
-            audio_input = self._room_io.audio_input
-            audio_ready = False
-
-            if audio_input is not None:
-                audio_ready = True
-                # Don't over-validate source/task, just existence is enough for greeting trigger
-            
-            if broadcast:
-                if audio_ready:
-                    break
-            else:
-                if (
-                    linked is not None
-                    and getattr(linked, "identity", None) == identity
-                    and audio_ready
-                ):
-                    break
-
-            if loop.time() > deadline:
-                raise TimeoutError(f"Timeout waiting for media {identity}")
-            await asyncio.sleep(0.1)
+        # Re-check only when a room event fired instead of polling every 100ms.
+        # A bare future + asyncio.wait avoids wrapping a coroutine in a task per wait.
+        try:
+            while not self._media_ready(identity, broadcast=broadcast):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise TimeoutError(f"Timeout waiting for media {identity}")
+                waiter = self._media_waiter = loop.create_future()
+                done, _ = await asyncio.wait((waiter,), timeout=remaining)
+                if not done:
+                    raise TimeoutError(f"Timeout waiting for media {identity}")
+        finally:
+            self._media_waiter = None
+
+    def _media_ready(self, identity: str, *, broadcast: bool) -> bool:
+        # Don't over-validate source/task, just existence is enough for greeting trigger
+        if self._room_io.audio_input is None:
+            return False
+        if broadcast:
+            return True
+        linked = self._room_io.linked_participant
+        return linked is not None and linked.identity == identity
 
     async def _send_greeting(self, identity: str) -> bool:
-        max_attempts = 3
-        for attempt in range(1, max_attempts + 1):
+        for attempt, retry_delay in enumerate((*_GREETING_RETRY_DELAYS, None), 1):
             try:
                 # Use conversation.item.create for a more direct injection if possible, 
                 # but sticking to generate_reply with text prompt for stability.
@@ -237,34 +310,34 @@ class ParticipantGreeter:
                 # Simply triggering response_create might be cleaner if the model has instructions to greet.
                 # But forcing it ensures it happens.
                 
-                _VIDEO_LOGGER.info("Sending greeting to %s (attempt %d)", identity, attempt)
-                handle = self._session.generate_reply(
-                    user_input=f"Say exactly: {self._greeting_text}"
-                )
+                if _VIDEO_LOGGER.isEnabledFor(logging.INFO):
+                    _VIDEO_LOGGER.info("Sending greeting to %s (attempt %d)", identity, attempt)
+                handle = self._session.generate_reply(user_input=self._greeting_prompt)
                 await handle.wait_for_playout()
                 return True
             except RealtimeError:
-                await asyncio.sleep(0.5)
+                if retry_delay is not None:
+                    await asyncio.sleep(retry_delay)
             except Exception as exc:
                 _VIDEO_LOGGER.warning("Failed to greet %s: %s", identity, exc)
                 return False
         return False
 
     def _handle_participant_disconnected(self, participant: Any) -> None:
-        identity = getattr(participant, "identity", None)
-        sid = getattr(participant, "sid", None)
-        if identity is None:
+        identity = participant.identity
+        sid = participant.sid
+        if not identity:
             return
 
         if sid:
             self._greeted_sids.discard(sid)
-            self._inflight_initializations.discard(sid)
+            self._pending_greetings.pop(sid, None)
         
         linked = self._room_io.linked_participant
         if linked is None:
             return
 
-        if getattr(linked, "identity", None) == identity:
+        if linked.identity == identity:
             self._room_io.unset_participant()
 
         self._maybe_schedule_shutdown()
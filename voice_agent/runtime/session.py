@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 from dataclasses import dataclass
@@ -8,8 +9,11 @@ from ..config import AgentConfig, _resolve_voice_override, _is_truthy
 _GEMINI_LOGGER = logging.getLogger("voice-agent.gemini")
 _VIDEO_LOGGER = logging.getLogger("voice-agent.video")
 
+_DEFAULT_SPEAKING_FPS = 1.0
+_DEFAULT_SILENT_FPS = 0.3
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SessionSettings:
     instructions: str
     model: str
@@ -19,7 +23,7 @@ class SessionSettings:
     gemini_api_key: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SessionArtifacts:
     session: Any
     room_input_options: Any
@@ -79,10 +83,11 @@ def derive_session_settings(
     )
 
 
+@functools.lru_cache(maxsize=1)
 def _resolve_gemini_api_key() -> Optional[str]:
     """
     Support both GOOGLE_API_KEY (default expected by the plugin)
-    and GEMINI_API_KEY (commonly used in docs for Gemini).
+    and GEMINI_API_KEY (commonly used in docs for Gemini). Resolved once per process.
     """
 
     return os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
@@ -120,6 +125,37 @@ def _resolve_gemini_tools(*, enable_search: bool) -> list[Any]:
         return []
 
 
+def _safe_float(value: str) -> Optional[float]:
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _video_sampler_fps() -> tuple[float, float]:
+    """Parse the VOICE_AGENT_VIDEO_FPS_* overrides once per process."""
+
+    speaking_fps_raw = os.getenv("VOICE_AGENT_VIDEO_FPS_SPEAKING")
+    silent_fps_raw = os.getenv("VOICE_AGENT_VIDEO_FPS_SILENT")
+    if speaking_fps_raw is None and silent_fps_raw is None:
+        return _DEFAULT_SPEAKING_FPS, _DEFAULT_SILENT_FPS
+
+    speaking_fps = (
+        _DEFAULT_SPEAKING_FPS if speaking_fps_raw is None else _safe_float(speaking_fps_raw)
+    )
+    silent_fps = _DEFAULT_SILENT_FPS if silent_fps_raw is None else _safe_float(silent_fps_raw)
+
+    if speaking_fps is None or silent_fps is None:
+        _VIDEO_LOGGER.warning(
+            "Invalid VOICE_AGENT_VIDEO_FPS_* values (%s, %s); falling back to defaults.",
+            speaking_fps_raw,
+            silent_fps_raw,
+        )
+        return _DEFAULT_SPEAKING_FPS, _DEFAULT_SILENT_FPS
+    return max(0.0, speaking_fps), max(0.0, silent_fps)
+
+
 def _resolve_video_sampler() -> Optional[Any]:
     """
     Build a voice-activity-aware video sampler so we only forward frames when needed.
@@ -131,19 +167,7 @@ def _resolve_video_sampler() -> Optional[Any]:
     except ImportError:
         return None
 
-    speaking_fps_raw = os.getenv("VOICE_AGENT_VIDEO_FPS_SPEAKING", "1.0")
-    silent_fps_raw = os.getenv("VOICE_AGENT_VIDEO_FPS_SILENT", "0.3")
-
-    try:
-        speaking_fps = max(0.0, float(speaking_fps_raw))
-        silent_fps = max(0.0, float(silent_fps_raw))
-    except ValueError:
-        _VIDEO_LOGGER.warning(
-            "Invalid VOICE_AGENT_VIDEO_FPS_* values (%s, %s); falling back to defaults.",
-            speaking_fps_raw,
-            silent_fps_raw,
-        )
-        speaking_fps, silent_fps = 1.0, 0.3
+    speaking_fps, silent_fps = _video_sampler_fps()
 
     return voice.VoiceActivityVideoSampler(
         speaking_fps=speaking_fps,
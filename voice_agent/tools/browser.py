@@ -1,18 +1,28 @@
 import asyncio
+import functools
 import json
 import logging
 import os
 import random
 import re
+from dataclasses import dataclass
 from typing import Any, Optional, Sequence
 from urllib.parse import urlparse
 from urllib import request as urllib_request
 from urllib import error as urllib_error
 
 from ..browser_pool import BrowserContextConfig, ProxyConfig, get_browser_pool
+from ..config import _env_bool, _is_truthy
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as _HTMLParser  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    _HTMLParser = None
 
 
 _BROWSER_LOGGER = logging.getLogger("voice-agent.browser")
+_WS_RE = re.compile(r"\s+")
+_DELAY_RANGE_SPLIT_RE = re.compile(r"[,;:/\-]+")
 _DEFAULT_USER_AGENTS: Sequence[str] = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15; rv:117.0) Gecko/20100101 Firefox/117.0",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.6422.78 Safari/537.36",
@@ -31,6 +41,288 @@ _DEFAULT_VIEWPORTS: Sequence[tuple[int, int]] = (
 )
 
 
+# Collapse whitespace and cap the length in the page, so at most `limit` characters
+# cross the CDP bridge instead of the full innerText of a heavy page.
+_BODY_TEXT_JS = """(limit) => {
+    const body = document.body;
+    return body ? body.innerText.replace(/\\s+/g, ' ').trim().slice(0, limit) : '';
+}"""
+
+_META_DESC_SELECTOR = 'meta[name="description"], meta[property="og:description"]'
+_META_DESC_JS = f"""() => {{
+    const tag = document.querySelector('{_META_DESC_SELECTOR}');
+    return tag ? tag.content : '';
+}}"""
+
+# Aborted when VOICE_AGENT_BROWSER_BLOCK_RESOURCES is on: heavy assets and frames
+# never contribute to the extracted text, trackers only add load. Extensions and
+# trackers are matched on the URL by the Playwright driver; the resource types also
+# catch extensionless asset URLs and every iframe document.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "subframe"})
+_TRACKER_URL_PATTERNS = (
+    r"://[^/]*google-analytics\.com/",
+    r"://[^/]*googletagmanager\.com/",
+    r"://[^/]*doubleclick\.net/",
+    r"://connect\.facebook\.net/",
+    r"://[^/]*hotjar\.com/",
+    r"://mc\.yandex\.ru/",
+)
+
+_WAIT_CONDITIONS = frozenset({"load", "domcontentloaded", "networkidle", "commit"})
+# Upper bound for the best-effort network-idle wait after DOMContentLoaded.
+_NETWORK_IDLE_WAIT_MS = 5000
+_BASE_CHROMIUM_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-gpu",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class _BrowserSettings:
+    """Env-derived browse_web_page settings; per-call randomisation is applied on top."""
+
+    home_url: str
+    user_agents: Sequence[str]
+    locale: str
+    timezone_id: str
+    timeout_ms: int
+    max_chars: int
+    viewport: Optional[tuple[int, int]]
+    chromium_args: tuple[str, ...]
+    wait_condition: str
+    extra_wait_ms: Optional[int]
+    delay_range: Optional[tuple[float, ...]]
+    idle_timeout: float
+    proxy_enabled: bool
+    proxy: Optional[ProxyConfig]
+    block_resources: bool
+    blocked_extensions: tuple[str, ...]
+    user_data_dir: Optional[str]
+
+
+# One entry per proxy in use: None, a static proxy, or one of the Webshare list
+# (20 entries with the default query).
+@functools.lru_cache(maxsize=32)
+def _context_config(
+    settings: _BrowserSettings, proxy: Optional[ProxyConfig]
+) -> BrowserContextConfig:
+    """
+    Return one shared BrowserContextConfig per settings/proxy pair so the pool's
+    context lookups match on `is` instead of comparing every field.
+    """
+
+    user_agent, viewport = _browser_identity(settings)
+    block = settings.block_resources
+    return BrowserContextConfig(
+        chromium_args=settings.chromium_args,
+        user_agent=user_agent,
+        locale=settings.locale,
+        timezone_id=settings.timezone_id,
+        viewport=viewport,
+        proxy=proxy,
+        blocked_resource_types=_BLOCKED_RESOURCE_TYPES if block else frozenset(),
+        blocked_extensions=settings.blocked_extensions if block else (),
+        block_url_patterns=_TRACKER_URL_PATTERNS if block else (),
+        disable_animations=True,
+        user_data_dir=settings.user_data_dir,
+    )
+
+
+def _resolve_int(
+    raw: int | str | None, fallback: int, minimum: int, maximum: int | None = None
+) -> int:
+    value = fallback
+    if raw not in (None, "", 0):
+        try:
+            value = int(raw)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            pass
+    value = max(minimum, value)
+    return value if maximum is None else min(maximum, value)
+
+
+def _parse_wait_value(value: str) -> Optional[int]:
+    normalized = value.strip().lower()
+    if not normalized:
+        return None
+    try:
+        if normalized.endswith("ms"):
+            return max(0, int(float(normalized[:-2])))
+        if normalized.endswith("s"):
+            return max(0, int(float(normalized[:-1]) * 1000))
+        if normalized.replace(".", "", 1).isdigit():
+            return max(0, int(float(normalized) * 1000))
+    except ValueError:
+        return None
+    return None
+
+
+def _coerce_wait_ms(value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return max(0, int(float(value) * 1000))
+    if isinstance(value, dict):
+        for key, factor in (
+            ("milliseconds", 1),
+            ("ms", 1),
+            ("seconds", 1000),
+            ("s", 1000),
+        ):
+            if key in value:
+                try:
+                    return max(0, int(float(value[key]) * factor))
+                except (TypeError, ValueError):
+                    continue
+        # Fallback: try to parse any first value as string
+        try:
+            first_val = next(iter(value.values()))
+        except StopIteration:
+            return None
+        return _parse_wait_value(str(first_val).strip())
+    if isinstance(value, str):
+        normalized = value.strip()
+        if not normalized:
+            return None
+        lowered = normalized.lower()
+        if lowered in _WAIT_CONDITIONS:
+            return None
+        return _parse_wait_value(normalized)
+    # Fallback: attempt to parse string representation
+    return _parse_wait_value(str(value).strip())
+
+
+@functools.lru_cache(maxsize=1)
+def _browser_settings() -> _BrowserSettings:
+    """Read the VOICE_AGENT_BROWSER_* environment once per process."""
+
+    env = os.environ
+
+    user_agents: Sequence[str] = _DEFAULT_USER_AGENTS
+    user_agent_setting = env.get("VOICE_AGENT_BROWSER_USER_AGENT", "").strip()
+    if user_agent_setting:
+        normalized = user_agent_setting
+        for sep in (",", "|", "\n"):
+            normalized = normalized.replace(sep, "\n")
+        user_agents = (
+            tuple(ua.strip() for ua in normalized.splitlines() if ua.strip())
+            or _DEFAULT_USER_AGENTS
+        )
+
+    viewport: Optional[tuple[int, int]] = None
+    viewport_width_env = env.get("VOICE_AGENT_BROWSER_VIEWPORT_WIDTH", "").strip()
+    viewport_height_env = env.get("VOICE_AGENT_BROWSER_VIEWPORT_HEIGHT", "").strip()
+    if viewport_width_env or viewport_height_env:
+        viewport = (
+            _resolve_int(viewport_width_env or None, fallback=1280, minimum=640, maximum=2560),
+            _resolve_int(viewport_height_env or None, fallback=720, minimum=480, maximum=1600),
+        )
+
+    wait_default = env.get("VOICE_AGENT_BROWSER_WAIT_UNTIL", "networkidle").strip().lower()
+
+    extra_wait_ms: Optional[int] = None
+    extra_wait_env = env.get("VOICE_AGENT_BROWSER_EXTRA_WAIT_MS", "").strip()
+    if extra_wait_env:
+        parsed_wait = _parse_wait_value(extra_wait_env)
+        extra_wait_ms = parsed_wait if parsed_wait is not None else 2000
+
+    delay_range: Optional[tuple[float, ...]] = None
+    random_jitter_env = env.get("VOICE_AGENT_BROWSER_RANDOM_DELAY_RANGE", "").strip()
+    if random_jitter_env:
+        try:
+            delay_range = tuple(
+                float(p) for p in _DELAY_RANGE_SPLIT_RE.split(random_jitter_env) if p.strip()
+            )
+        except ValueError:
+            delay_range = ()
+
+    idle_timeout_raw = env.get("VOICE_AGENT_BROWSER_IDLE_SECONDS", "60").strip()
+    try:
+        idle_timeout = float(idle_timeout_raw) if idle_timeout_raw else 60.0
+    except ValueError:
+        idle_timeout = 60.0
+
+    proxy = None
+    proxy_server = env.get("VOICE_AGENT_BROWSER_PROXY_SERVER", "").strip()
+    if proxy_server:
+        proxy = ProxyConfig(
+            server=proxy_server,
+            username=env.get("VOICE_AGENT_BROWSER_PROXY_USERNAME", "").strip() or None,
+            password=env.get("VOICE_AGENT_BROWSER_PROXY_PASSWORD", "").strip() or None,
+            bypass=env.get("VOICE_AGENT_BROWSER_PROXY_BYPASS", "").strip() or None,
+        )
+
+    return _BrowserSettings(
+        home_url=env.get("VOICE_AGENT_BROWSER_HOME", "").strip(),
+        user_agents=user_agents,
+        locale=env.get("VOICE_AGENT_BROWSER_LOCALE", "uk-UA").strip() or "uk-UA",
+        timezone_id=env.get("VOICE_AGENT_BROWSER_TIMEZONE", "Europe/Kyiv"),
+        timeout_ms=_resolve_int(
+            env.get("VOICE_AGENT_BROWSER_TIMEOUT_MS", "").strip() or None,
+            fallback=15000,
+            minimum=1000,
+            maximum=60000,
+        ),
+        max_chars=_resolve_int(
+            env.get("VOICE_AGENT_BROWSER_MAX_CHARS", "").strip() or None, 2500, 500, 12000
+        ),
+        viewport=viewport,
+        chromium_args=_BASE_CHROMIUM_ARGS
+        + tuple(env.get("VOICE_AGENT_BROWSER_CHROMIUM_ARGS", "").split()),
+        wait_condition=wait_default if wait_default in _WAIT_CONDITIONS else "networkidle",
+        extra_wait_ms=extra_wait_ms,
+        delay_range=delay_range,
+        idle_timeout=max(0.0, min(idle_timeout, 3600.0)),
+        proxy_enabled=_is_truthy(env.get("VOICE_AGENT_BROWSER_ENABLE_PROXY", "1")),
+        proxy=proxy,
+        block_resources=_env_bool("VOICE_AGENT_BROWSER_BLOCK_RESOURCES", True),
+        blocked_extensions=tuple(
+            ext.strip().lower()
+            for ext in env.get(
+                "VOICE_AGENT_BROWSER_BLOCK_EXT",
+                ".ico,.png,.jpg,.jpeg,.gif,.svg,.webp,.avif,.mp4,.webm,.woff,.woff2,.ttf,.otf",
+            ).split(",")
+            if ext.strip()
+        ),
+        user_data_dir=env.get("VOICE_AGENT_BROWSER_USER_DATA_DIR", "").strip() or None,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _browser_identity(settings: _BrowserSettings) -> tuple[str, tuple[int, int]]:
+    """
+    User agent and viewport for this process. Picked once rather than per call so
+    calls share a warm browser context; a persistent profile always gets the first.
+    """
+
+    if settings.user_data_dir is not None:
+        return settings.user_agents[0], settings.viewport or _DEFAULT_VIEWPORTS[0]
+    return (
+        random.choice(settings.user_agents),
+        settings.viewport or random.choice(_DEFAULT_VIEWPORTS),
+    )
+
+
+def _default_extra_wait_ms(settings: _BrowserSettings) -> int:
+    """Post-load wait: the env value, the env delay range, or 1-3.5 s at random."""
+
+    base = settings.extra_wait_ms if settings.extra_wait_ms is not None else 2000
+    parts = settings.delay_range
+    if parts is None:
+        if settings.extra_wait_ms is not None:
+            return base
+        return int(random.uniform(1.0, 3.5) * 1000)
+    if len(parts) == 1:
+        return base + max(0, int(parts[0] * 1000))
+    if len(parts) >= 2:
+        low = max(0.0, min(parts[0], parts[1]))
+        high = max(parts[0], parts[1])
+        return int(random.uniform(low, high) * 1000)
+    return base
+
+
 async def browse_web_page(
     _: Any,
     url: str,
@@ -47,9 +339,8 @@ async def browse_web_page(
             "`playwright install chromium`."
         )
 
-    url_value = (url or "").strip()
-    if not url_value:
-        url_value = os.getenv("VOICE_AGENT_BROWSER_HOME", "").strip()
+    settings = _browser_settings()
+    url_value = (url or "").strip() or settings.home_url
     if not url_value:
         return "Будь ласка, надайте URL сторінки або встановіть VOICE_AGENT_BROWSER_HOME."
 
@@ -61,161 +352,19 @@ async def browse_web_page(
         return "URL виглядає некоректним. Перевірте адресу і спробуйте ще раз."
     final_url = parsed.geturl()
 
-    user_agent_setting = os.getenv("VOICE_AGENT_BROWSER_USER_AGENT", "").strip()
-    user_agent_choices: Sequence[str]
-    if user_agent_setting:
-        separators = (",", "|", "\n")
-        normalized = user_agent_setting
-        for sep in separators:
-            normalized = normalized.replace(sep, "\n")
-        user_agent_choices = tuple(
-            ua.strip() for ua in normalized.splitlines() if ua.strip()
-        )
-        if not user_agent_choices:
-            user_agent_choices = _DEFAULT_USER_AGENTS
-    else:
-        user_agent_choices = _DEFAULT_USER_AGENTS
-    user_agent = random.choice(user_agent_choices)
-
-    locale = os.getenv("VOICE_AGENT_BROWSER_LOCALE", "uk-UA").strip() or "uk-UA"
-    timeout_ms_raw = os.getenv("VOICE_AGENT_BROWSER_TIMEOUT_MS", "").strip()
-    wait_default = os.getenv("VOICE_AGENT_BROWSER_WAIT_UNTIL", "networkidle").strip()
-    max_chars_env = os.getenv("VOICE_AGENT_BROWSER_MAX_CHARS", "").strip()
-    proxy_server = os.getenv("VOICE_AGENT_BROWSER_PROXY_SERVER", "").strip()
-    proxy_username = os.getenv("VOICE_AGENT_BROWSER_PROXY_USERNAME", "").strip() or None
-    proxy_password = os.getenv("VOICE_AGENT_BROWSER_PROXY_PASSWORD", "").strip() or None
-    proxy_bypass = os.getenv("VOICE_AGENT_BROWSER_PROXY_BYPASS", "").strip() or None
-
-    def _resolve_int(
-        raw: int | str | None, fallback: int, minimum: int, maximum: int | None = None
-    ) -> int:
-        candidate = raw
-        if candidate in (None, "", 0):
-            candidate = fallback
-        try:
-            value = int(candidate)  # type: ignore[arg-type]
-        except (TypeError, ValueError):
-            value = fallback
-        value = max(minimum, value)
-        if maximum is not None:
-            value = min(maximum, value)
-        return value
-
-    timeout_ms = _resolve_int(timeout_ms_raw or None, fallback=15000, minimum=1000, maximum=60000)
+    timeout_ms = settings.timeout_ms
     max_chars_val = _resolve_int(
         max_chars if isinstance(max_chars, (int, str)) else None,
-        fallback=_resolve_int(max_chars_env or None, 2500, 500, 12000),
+        fallback=settings.max_chars,
         minimum=500,
         maximum=12000,
     )
-    viewport_width_env = os.getenv("VOICE_AGENT_BROWSER_VIEWPORT_WIDTH", "").strip()
-    viewport_height_env = os.getenv("VOICE_AGENT_BROWSER_VIEWPORT_HEIGHT", "").strip()
-    if viewport_width_env or viewport_height_env:
-        viewport_width = _resolve_int(
-            viewport_width_env or None,
-            fallback=1280,
-            minimum=640,
-            maximum=2560,
-        )
-        viewport_height = _resolve_int(
-            viewport_height_env or None,
-            fallback=720,
-            minimum=480,
-            maximum=1600,
-        )
-    else:
-        viewport_width, viewport_height = random.choice(_DEFAULT_VIEWPORTS)
-
-    chromium_args = [
-        "--disable-blink-features=AutomationControlled",
-        "--disable-dev-shm-usage",
-        "--no-sandbox",
-        "--disable-gpu",
-    ]
-    extra_args = os.getenv("VOICE_AGENT_BROWSER_CHROMIUM_ARGS", "").strip()
-    if extra_args:
-        chromium_args.extend(arg for arg in extra_args.split() if arg)
-
-    def _parse_wait_value(value: str) -> Optional[int]:
-        normalized = value.strip().lower()
-        if not normalized:
-            return None
-        try:
-            if normalized.endswith("ms"):
-                return max(0, int(float(normalized[:-2])))
-            if normalized.endswith("s"):
-                return max(0, int(float(normalized[:-1]) * 1000))
-            if normalized.replace(".", "", 1).isdigit():
-                return max(0, int(float(normalized) * 1000))
-        except ValueError:
-            return None
-        return None
-
-    allowed_wait_conditions = {"load", "domcontentloaded", "networkidle", "commit"}
-    wait_default_normalized = (wait_default or "").lower()
-    wait_condition = (
-        wait_default_normalized if wait_default_normalized in allowed_wait_conditions else "networkidle"
-    )
-    extra_wait_ms = 2000
-
-    extra_wait_env = os.getenv("VOICE_AGENT_BROWSER_EXTRA_WAIT_MS", "").strip()
-    if extra_wait_env:
-        parsed_wait = _parse_wait_value(extra_wait_env)
-        if parsed_wait is not None:
-            extra_wait_ms = parsed_wait
-
-    def _coerce_wait_ms(value: Any) -> Optional[int]:
-        if value is None:
-            return None
-        if isinstance(value, (int, float)):
-            return max(0, int(float(value) * 1000))
-        if isinstance(value, dict):
-            for key, factor in (
-                ("milliseconds", 1),
-                ("ms", 1),
-                ("seconds", 1000),
-                ("s", 1000),
-            ):
-                if key in value:
-                    try:
-                        return max(0, int(float(value[key]) * factor))
-                    except (TypeError, ValueError):
-                        continue
-            # Fallback: try to parse any first value as string
-            try:
-                first_val = next(iter(value.values()))
-            except StopIteration:
-                return None
-            return _parse_wait_value(str(first_val).strip())
-        if isinstance(value, str):
-            normalized = value.strip()
-            if not normalized:
-                return None
-            lowered = normalized.lower()
-            if lowered in allowed_wait_conditions:
-                return None
-            return _parse_wait_value(normalized)
-        # Fallback: attempt to parse string representation
-        return _parse_wait_value(str(value).strip())
-
-    random_jitter_env = os.getenv("VOICE_AGENT_BROWSER_RANDOM_DELAY_RANGE", "").strip()
-    if random_jitter_env:
-        try:
-            parts = [float(p) for p in re.split(r"[,;:/\-]+", random_jitter_env) if p.strip()]
-        except ValueError:
-            parts = []
-        if len(parts) == 1:
-            extra_wait_ms += max(0, int(parts[0] * 1000))
-        elif len(parts) >= 2:
-            low = max(0.0, min(parts[0], parts[1]))
-            high = max(parts[0], parts[1])
-            extra_wait_ms = int(random.uniform(low, high) * 1000)
-    elif not extra_wait_env:
-        extra_wait_ms = int(random.uniform(1.0, 3.5) * 1000)
 
+    wait_condition = settings.wait_condition
+    extra_wait_ms = _default_extra_wait_ms(settings)
     if isinstance(wait, str):
         lowered = wait.strip().lower()
-        if lowered in allowed_wait_conditions:
+        if lowered in _WAIT_CONDITIONS:
             wait_condition = lowered
         else:
             parsed_wait = _coerce_wait_ms(wait)
@@ -227,32 +376,9 @@ async def browse_web_page(
         if parsed_wait is not None:
             extra_wait_ms = parsed_wait
 
-    idle_timeout_raw = os.getenv("VOICE_AGENT_BROWSER_IDLE_SECONDS", "60").strip()
-    try:
-        idle_timeout = float(idle_timeout_raw) if idle_timeout_raw else 60.0
-    except ValueError:
-        idle_timeout = 60.0
-    idle_timeout = max(0.0, min(idle_timeout, 3600.0))
-
-    proxy_enabled = os.getenv("VOICE_AGENT_BROWSER_ENABLE_PROXY", "1").strip().lower() not in {
-        "",
-        "0",
-        "false",
-        "no",
-        "off",
-    }
-
     proxy = None
-    if proxy_enabled:
-        if proxy_server:
-            proxy = ProxyConfig(
-                server=proxy_server,
-                username=proxy_username,
-                password=proxy_password,
-                bypass=proxy_bypass,
-            )
-        else:
-            proxy = await _maybe_fetch_webshare_proxy()
+    if settings.proxy_enabled:
+        proxy = settings.proxy or await _maybe_fetch_webshare_proxy()
 
     pool = get_browser_pool()
     page = None
@@ -260,71 +386,35 @@ async def browse_web_page(
 
     try:
         page = await pool.acquire_page(
-            config=BrowserContextConfig(
-                chromium_args=tuple(chromium_args),
-                user_agent=user_agent,
-                locale=locale,
-                timezone_id=os.getenv("VOICE_AGENT_BROWSER_TIMEZONE", "Europe/Kyiv"),
-                viewport=(viewport_width, viewport_height),
-                proxy=proxy,
-            ),
+            config=_context_config(settings, proxy),
             launch_timeout_ms=timeout_ms,
-            idle_timeout_s=idle_timeout,
+            idle_timeout_s=settings.idle_timeout,
         )
         page.set_default_timeout(timeout_ms)
         page.set_default_navigation_timeout(timeout_ms)
 
-        block_resources_setting = os.getenv("VOICE_AGENT_BROWSER_BLOCK_RESOURCES", "1").strip().lower()
-        block_resources = block_resources_setting not in {"", "0", "false", "no"}
-        blocked_types = {"image", "media", "font"}
-        blocked_extensions = tuple(
-            ext.strip().lower()
-            for ext in os.getenv("VOICE_AGENT_BROWSER_BLOCK_EXT", ".ico,.png,.jpg,.jpeg,.gif,.svg,.webp,.mp4,.webm").split(",")
-            if ext.strip()
-        )
-
-        if block_resources:
-            async def _route_handler(route):  # type: ignore[no-untyped-def]
-                try:
-                    req = route.request
-                    resource_type = req.resource_type
-                    req_url = req.url.lower()
-                    if resource_type == "subframe":
-                        await route.abort()
-                        return
-                    if resource_type in blocked_types:
-                        await route.abort()
-                        return
-                    if blocked_extensions and any(req_url.endswith(ext) for ext in blocked_extensions):
-                        await route.abort()
-                        return
-                    await route.continue_()
-                except Exception:
-                    await route.continue_()
-
-            await page.route("**/*", _route_handler)
-
-        await page.goto(final_url, wait_until=wait_condition or "networkidle", timeout=timeout_ms)
+        if wait_condition == "networkidle":
+            # Ads and analytics can keep a page from ever going idle: navigate until the
+            # DOM is ready and give network idle only a bounded, best-effort wait.
+            await page.goto(final_url, wait_until="domcontentloaded", timeout=timeout_ms)
+            try:
+                await page.wait_for_load_state(
+                    "networkidle", timeout=min(_NETWORK_IDLE_WAIT_MS, timeout_ms)
+                )
+            except PlaywrightTimeout:
+                pass
+        else:
+            await page.goto(final_url, wait_until=wait_condition, timeout=timeout_ms)
         if extra_wait_ms > 0:
             await page.wait_for_timeout(extra_wait_ms)
 
-        try:
-            meta_title = await page.title()
-        except Exception:
-            meta_title = ""
-        try:
-            meta_desc = await page.evaluate(
-                """() => {
-                    const tag = document.querySelector('meta[name="description"], meta[property="og:description"]');
-                    return tag ? tag.content : '';
-                }"""
-            )
-        except Exception:
-            meta_desc = ""
-        try:
-            main_text = await page.inner_text("body")
-        except Exception:
-            main_text = ""
+        meta_title, meta_desc, main_text = await _read_page_text(page, max_chars_val)
+        # At most max_chars_val characters survive truncation below; cap before the
+        # whitespace pass so huge pages never get normalised in full.
+        text_cap = max_chars_val * 2
+        meta_title = _text_or_empty(meta_title)
+        meta_desc = _text_or_empty(meta_desc)[:text_cap]
+        main_text = _text_or_empty(main_text)[:text_cap]
 
         chunks = []
         if meta_title:
@@ -332,7 +422,7 @@ async def browse_web_page(
         if meta_desc:
             chunks.append(meta_desc.strip())
         if main_text:
-            cleaned = re.sub(r"\s+", " ", main_text)
+            cleaned = _WS_RE.sub(" ", main_text)
             chunks.append(cleaned.strip())
         text_result = "\n".join(filter(None, chunks)).strip()
     except RuntimeError as exc:
@@ -359,6 +449,43 @@ async def browse_web_page(
     return text_result
 
 
+def _text_or_empty(value: Any) -> str:
+    return value if isinstance(value, str) else ""
+
+
+async def _read_page_text(page: Any, limit: int) -> tuple[Any, Any, Any]:
+    """Return (title, meta description, body text); items may be exceptions."""
+
+    if _HTMLParser is not None:
+        # One CDP call for the serialized DOM; parsing happens in C, no layout pass.
+        try:
+            fields = _extract_page_fields(await page.content())
+        except Exception:
+            fields = None
+        if fields is not None and fields[2]:
+            return fields
+    # Independent reads: overlap the CDP round-trips instead of awaiting each in turn.
+    meta_title, meta_desc, main_text = await asyncio.gather(
+        page.title(),
+        page.evaluate(_META_DESC_JS),
+        page.evaluate(_BODY_TEXT_JS, limit),
+        return_exceptions=True,
+    )
+    return meta_title, meta_desc, main_text
+
+
+def _extract_page_fields(html: str) -> tuple[str, str, str]:
+    tree = _HTMLParser(html)
+    title_node = tree.css_first("title")
+    meta_node = tree.css_first(_META_DESC_SELECTOR)
+    title = title_node.text(strip=True) if title_node is not None else ""
+    meta_desc = (meta_node.attributes.get("content") or "") if meta_node is not None else ""
+    tree.strip_tags(["script", "style", "noscript", "iframe", "template"])
+    body = tree.body
+    main_text = body.text(separator="\n", strip=True) if body is not None else ""
+    return title, meta_desc, main_text
+
+
 async def _maybe_fetch_webshare_proxy() -> Optional[ProxyConfig]:
     api_key = os.getenv("VOICE_AGENT_WEBSHARE_API_KEY", "").strip()
     if not api_key:
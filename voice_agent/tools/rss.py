@@ -1,11 +1,16 @@
 import asyncio
+import concurrent.futures
 import functools
+import io
 import json
 import logging
 import os
 import re
+import time
+import weakref
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable, List
+from typing import Any, Iterable, List, Optional
 
 from html import unescape
 from urllib import error as urllib_error
@@ -16,9 +21,301 @@ _DEFAULT_CATALOG_PATH = Path(__file__).resolve().parent.parent / "data" / "rss_f
 _CATALOG_ENV_VAR = "VOICE_AGENT_RSS_CATALOG_FILE"
 _RSS_LOGGER = logging.getLogger("voice-agent.rss")
 
+_WS_RE = re.compile(r"\s+")
+_TAG_RE = re.compile(r"<[^>]+>")
+
 _FEED_CACHE: List[dict[str, Any]] | None = None
 _FEED_CACHE_PATH: Path | None = None
 
+# Parsed entries per feed URL. Within _RESPONSE_FRESH_SECONDS they are reused
+# as-is; after that a conditional GET (ETag/Last-Modified) revalidates them.
+_RESPONSE_CACHE_LIMIT = 32
+# fetch_rss_news never shows more entries than this, so parsing stops there.
+_MAX_FEED_ENTRIES = 10
+_RESPONSE_FRESH_SECONDS = 60.0
+
+
+@dataclass(slots=True, frozen=True)
+class _CachedFeed:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    entries: list[Any]
+    fetched_at: float
+
+
+_RESPONSE_CACHE: dict[str, _CachedFeed] = {}
+
+# CPU-bound feed parsing gets its own workers so it never queues behind (or
+# blocks) network I/O on the loop's default executor. Threads start on demand.
+_PARSE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="rss-parse"
+)
+
+# Feeds are a few hundred KiB at most; anything past the cap is refused rather
+# than buffered whole into memory on an executor thread.
+_MAX_FEED_BYTES = 5 * 1024 * 1024
+_FEED_READ_CHUNK = 64 * 1024
+
+
+class _FeedTooLargeError(Exception):
+    pass
+
+
+# One client per event loop, held with the async generator that closes it.
+_RSS_HTTP_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[Any, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_RSS_DOWNLOAD_ERRORS: tuple[type[BaseException], ...] = (
+    urllib_error.URLError,
+    TimeoutError,
+    _FeedTooLargeError,
+)
+
+
+async def _client_lifetime(loop: asyncio.AbstractEventLoop, client: Any) -> Any:
+    # A loop finalises pending async generators in shutdown_asyncgens() (asyncio.run
+    # calls it before closing), so the pool is closed on the loop it belongs to.
+    try:
+        yield client
+    finally:
+        _RSS_HTTP_CLIENTS.pop(loop, None)
+        await client.aclose()
+
+
+async def _rss_http_client() -> Any:
+    """
+    Shared httpx.AsyncClient so repeated fetches from the same feed host reuse
+    the TCP/TLS connection without an executor hop. Its pool is bound to the
+    running loop, so each loop gets its own client, closed when that loop shuts
+    down. Returns None (urllib in the default executor) without httpx.
+    """
+
+    global _RSS_DOWNLOAD_ERRORS
+    loop = asyncio.get_running_loop()
+    held = _RSS_HTTP_CLIENTS.get(loop)
+    if held is not None:
+        return held[0]
+    try:
+        import httpx  # type: ignore
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    client = httpx.AsyncClient(
+        timeout=15,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+    )
+    lifetime = _client_lifetime(loop, client)
+    _RSS_HTTP_CLIENTS[loop] = (client, lifetime)
+    # Starting the generator registers it with the loop's async-generator hooks.
+    await lifetime.__anext__()
+    _RSS_DOWNLOAD_ERRORS = (
+        urllib_error.URLError,
+        TimeoutError,
+        _FeedTooLargeError,
+        httpx.HTTPError,
+    )
+    return client
+
+
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_CONTENT_ENCODED_TAG = "{http://purl.org/rss/1.0/modules/content/}encoded"
+_MEDIA_CONTENT_TAG = "{http://search.yahoo.com/mrss/}content"
+
+
+# Feeds below this size are parsed on the loop thread when lxml is available:
+# libxml2 gets through them faster than the executor hand-off costs.
+_INLINE_PARSE_LIMIT = 256 * 1024
+
+_LXML_ETREE: Any = None
+
+
+def _lxml_etree() -> Any:
+    """Import lxml.etree once; None when lxml is not installed (also remembered)."""
+
+    global _LXML_ETREE
+    if _LXML_ETREE is None:
+        try:
+            from lxml import etree  # type: ignore
+        except ImportError:  # pragma: no cover - optional dependency
+            _LXML_ETREE = False
+        else:
+            _LXML_ETREE = etree
+    return _LXML_ETREE or None
+
+
+def _xml_text(element: Any) -> str:
+    return "".join(element.itertext()).strip() if element is not None else ""
+
+
+def _parse_rss_item(item: Any) -> dict[str, Any]:
+    description = _xml_text(item.find("description"))
+    entry: dict[str, Any] = {
+        "title": _xml_text(item.find("title")),
+        "link": _xml_text(item.find("link")),
+        "id": _xml_text(item.find("guid")),
+        "published": _xml_text(item.find("pubDate")),
+        "summary": description,
+        "description": description,
+    }
+    encoded = _xml_text(item.find(_CONTENT_ENCODED_TAG))
+    if encoded:
+        entry["content"] = [{"value": encoded}]
+        entry["content_encoded"] = encoded
+    media = [dict(node.attrib) for node in item.iter(_MEDIA_CONTENT_TAG)]
+    if media:
+        entry["media_content"] = media
+    return entry
+
+
+def _parse_atom_entry(item: Any) -> dict[str, Any]:
+    link = ""
+    for node in item.iter(f"{_ATOM_NS}link"):
+        if node.get("rel", "alternate") == "alternate":
+            link = node.get("href", "")
+            break
+    entry: dict[str, Any] = {
+        "title": _xml_text(item.find(f"{_ATOM_NS}title")),
+        "link": link,
+        "id": _xml_text(item.find(f"{_ATOM_NS}id")),
+        "published": _xml_text(item.find(f"{_ATOM_NS}published")),
+        "updated": _xml_text(item.find(f"{_ATOM_NS}updated")),
+        "summary": _xml_text(item.find(f"{_ATOM_NS}summary")),
+    }
+    content = _xml_text(item.find(f"{_ATOM_NS}content"))
+    if content:
+        entry["content"] = [{"value": content}]
+    return entry
+
+
+def _parse_feed_entries(feed_bytes: bytes) -> list[dict[str, Any]] | None:
+    """
+    Parse up to _MAX_FEED_ENTRIES RSS 2.0 / Atom entries with lxml (C, libxml2)
+    into the same keys feedparser exposes, stopping once enough are read. Returns
+    None when lxml is missing, the document does not parse, or it is some other
+    format, so the caller can use feedparser.
+    """
+
+    etree = _lxml_etree()
+    if etree is None:
+        return None
+
+    # No entity expansion or network access for untrusted feed documents.
+    events = etree.iterparse(
+        io.BytesIO(feed_bytes),
+        events=("start", "end"),
+        resolve_entities=False,
+        no_network=True,
+    )
+    entries: list[dict[str, Any]] = []
+    item_tag = ""
+    parse_item: Any = None
+    try:
+        for event, element in events:
+            if parse_item is None:
+                # The first event is the root start tag; it decides the format.
+                if element.tag == "rss":
+                    item_tag, parse_item = "item", _parse_rss_item
+                elif element.tag == f"{_ATOM_NS}feed":
+                    item_tag, parse_item = f"{_ATOM_NS}entry", _parse_atom_entry
+                else:
+                    return None
+                continue
+            if event != "end" or element.tag != item_tag:
+                continue
+            entries.append(parse_item(element))
+            if len(entries) >= _MAX_FEED_ENTRIES:
+                break
+            element.clear()
+    except etree.XMLSyntaxError:
+        return None
+    return entries or None
+
+
+@functools.lru_cache(maxsize=1)
+def _rss_base_headers() -> tuple[tuple[str, str], ...]:
+    """Request headers derived from the environment, read once per process."""
+
+    return (
+        (
+            "User-Agent",
+            os.getenv("VOICE_AGENT_RSS_USER_AGENT", "VoiceAgentRSS/1.0 (+https://livekit.io)"),
+        ),
+        ("Accept", "application/rss+xml, application/xml;q=0.9, */*;q=0.8"),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _rss_limit_default() -> int:
+    raw = os.getenv("VOICE_AGENT_RSS_LIMIT", "").strip()
+    try:
+        return int(raw) if raw else 3
+    except ValueError:
+        return 3
+
+
+def _check_content_length(content_length: Optional[str]) -> None:
+    if content_length and content_length.isdigit() and int(content_length) > _MAX_FEED_BYTES:
+        raise _FeedTooLargeError("стрічка більша за 5 МіБ")
+
+
+def _append_capped(body: bytearray, chunk: bytes) -> None:
+    body += chunk
+    if len(body) > _MAX_FEED_BYTES:
+        raise _FeedTooLargeError("стрічка більша за 5 МіБ")
+
+
+def _request_headers(etag: Optional[str], last_modified: Optional[str]) -> dict[str, str]:
+    headers = dict(_rss_base_headers())
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+async def _download_feed_async(
+    url: str, client: Any, etag: Optional[str], last_modified: Optional[str]
+) -> tuple[Optional[bytes], Optional[str], Optional[str]]:
+    """Return (body, etag, last_modified); body is None when the server answers 304."""
+
+    async with client.stream("GET", url, headers=_request_headers(etag, last_modified)) as response:
+        if response.status_code == 304:
+            return None, etag, last_modified
+        response.raise_for_status()
+        _check_content_length(response.headers.get("Content-Length"))
+        body = bytearray()
+        async for chunk in response.aiter_bytes(_FEED_READ_CHUNK):
+            _append_capped(body, chunk)
+        return bytes(body), response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+
+def _download_feed(
+    url: str, etag: Optional[str], last_modified: Optional[str]
+) -> tuple[Optional[bytes], Optional[str], Optional[str]]:
+    """Blocking urllib variant of _download_feed_async, run in the default executor."""
+
+    req = urllib_request.Request(url, headers=_request_headers(etag, last_modified))
+    try:
+        with urllib_request.urlopen(req, timeout=15) as response:
+            _check_content_length(response.headers.get("Content-Length"))
+            body = bytearray()
+            for chunk in iter(functools.partial(response.read, _FEED_READ_CHUNK), b""):
+                _append_capped(body, chunk)
+            return bytes(body), response.headers.get("ETag"), response.headers.get("Last-Modified")
+    except urllib_error.HTTPError as exc:
+        if exc.code == 304:
+            return None, etag, last_modified
+        raise
+
+
+def _remember_feed(
+    url: str, etag: Optional[str], last_modified: Optional[str], entries: list[Any]
+) -> None:
+    _RESPONSE_CACHE.pop(url, None)
+    if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_LIMIT:
+        _RESPONSE_CACHE.pop(next(iter(_RESPONSE_CACHE)))
+    _RESPONSE_CACHE[url] = _CachedFeed(etag, last_modified, entries, time.monotonic())
+
 
 def _read_catalog_file(path: Path) -> list[dict[str, Any]]:
     try:
@@ -81,7 +378,7 @@ def _load_feed_catalog() -> list[dict[str, Any]]:
 
 
 def _normalize_token(value: str) -> str:
-    cleaned = re.sub(r"\s+", " ", value.strip())
+    cleaned = _WS_RE.sub(" ", value.strip())
     return cleaned.casefold()
 
 
@@ -119,13 +416,65 @@ def describe_feed_catalog() -> str:
     return "\n".join(lines)
 
 
-async def fetch_rss_news(_: Any, feed_url: str = "", limit: int | str = 3) -> str:
-    """Fetch and summarise entries from an RSS feed defined in the catalog."""
+async def _fetch_feed_entries(target_url: str, cached: Optional[_CachedFeed]) -> list[Any] | str:
+    """Download and parse a feed; returns the entries or a user-facing error message."""
+
+    loop = asyncio.get_running_loop()
+    client = await _rss_http_client()
+    etag = cached.etag if cached is not None else None
+    last_modified = cached.last_modified if cached is not None else None
 
     try:
-        import feedparser  # type: ignore
-    except ImportError:
-        return "Модуль для читання RSS наразі не встановлений."
+        if client is not None:
+            feed_bytes, etag, last_modified = await _download_feed_async(
+                target_url, client, etag, last_modified
+            )
+        else:
+            feed_bytes, etag, last_modified = await loop.run_in_executor(
+                None, _download_feed, target_url, etag, last_modified
+            )
+    except _RSS_DOWNLOAD_ERRORS as exc:
+        return f"Не вдалося завантажити RSS ({exc})."
+
+    if feed_bytes is None:
+        if cached is None:  # pragma: no cover - 304 without validators
+            return "Не вдалося завантажити RSS (сервер не повернув вмісту)."
+        # 304 Not Modified: the entries parsed last time are still current.
+        _remember_feed(target_url, etag, last_modified, cached.entries)
+        return cached.entries
+
+    if len(feed_bytes) < _INLINE_PARSE_LIMIT and _lxml_etree() is not None:
+        entries = _parse_feed_entries(feed_bytes)
+    else:
+        entries = await loop.run_in_executor(_PARSE_EXECUTOR, _parse_feed_entries, feed_bytes)
+    if entries is None:
+        # Malformed or less common formats (RSS 1.0, ...): feedparser copes with those.
+        try:
+            import feedparser  # type: ignore
+        except ImportError:
+            return "Модуль для читання RSS наразі не встановлений."
+
+        parsed = await loop.run_in_executor(
+            _PARSE_EXECUTOR,
+            functools.partial(feedparser.parse, feed_bytes),
+        )
+        if getattr(parsed, "bozo", False):
+            error = getattr(parsed, "bozo_exception", None)
+            return f"Не вдалося розібрати RSS: {error!r}" if error else "Не вдалося розібрати RSS."
+
+        entries = getattr(parsed, "entries", []) or []
+        if not entries:
+            status = getattr(parsed, "status", None)
+            if status and status != 200:
+                return f"Стрічка повернула статус {status}, записи відсутні."
+            return "У стрічці немає публікацій."
+
+    _remember_feed(target_url, etag, last_modified, entries)
+    return entries
+
+
+async def fetch_rss_news(_: Any, feed_url: str = "", limit: int | str = 3) -> str:
+    """Fetch and summarise entries from an RSS feed defined in the catalog."""
 
     catalog = _load_feed_catalog()
     feed_arg = feed_url.strip() if isinstance(feed_url, str) else ""
@@ -152,54 +501,29 @@ async def fetch_rss_news(_: Any, feed_url: str = "", limit: int | str = 3) -> st
     def _resolve_limit(raw: int | str | None) -> int:
         candidate: int | str | None = raw
         if candidate in ("", None):
-            candidate = os.getenv("VOICE_AGENT_RSS_LIMIT", "").strip() or 3
+            candidate = _rss_limit_default()
         try:
             value = int(candidate)  # type: ignore[arg-type]
         except (TypeError, ValueError):
             value = 3
-        return max(1, min(value, 10))
+        return max(1, min(value, _MAX_FEED_ENTRIES))
 
     provided_limit: int | str | None = limit if isinstance(limit, (int, str)) else None
     limit_value = _resolve_limit(provided_limit)
 
-    loop = asyncio.get_running_loop()
-
-    def _download_feed() -> bytes:
-        headers = {
-            "User-Agent": os.getenv(
-                "VOICE_AGENT_RSS_USER_AGENT",
-                "VoiceAgentRSS/1.0 (+https://livekit.io)",
-            ),
-            "Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8",
-        }
-        req = urllib_request.Request(target_url, headers=headers)
-        with urllib_request.urlopen(req, timeout=15) as response:
-            return response.read()
-
-    try:
-        feed_bytes = await loop.run_in_executor(None, _download_feed)
-    except (urllib_error.URLError, urllib_error.HTTPError, TimeoutError) as exc:
-        return f"Не вдалося завантажити RSS ({exc})."
-
-    parsed = await loop.run_in_executor(
-        None,
-        functools.partial(feedparser.parse, feed_bytes),
-    )
-    if getattr(parsed, "bozo", False):
-        error = getattr(parsed, "bozo_exception", None)
-        return f"Не вдалося розібрати RSS: {error!r}" if error else "Не вдалося розібрати RSS."
-
-    entries = getattr(parsed, "entries", []) or []
-    if not entries:
-        status = getattr(parsed, "status", None)
-        if status and status != 200:
-            return f"Стрічка повернула статус {status}, записи відсутні."
-        return "У стрічці немає публікацій."
+    cached = _RESPONSE_CACHE.get(target_url)
+    if cached is not None and time.monotonic() - cached.fetched_at < _RESPONSE_FRESH_SECONDS:
+        entries = cached.entries
+    else:
+        entries_or_error = await _fetch_feed_entries(target_url, cached)
+        if isinstance(entries_or_error, str):
+            return entries_or_error
+        entries = entries_or_error
 
     entries_output: list[str] = []
 
     def _clean_text(value: str) -> str:
-        stripped = re.sub(r"\s+", " ", value).strip()
+        stripped = _WS_RE.sub(" ", value).strip()
         return stripped
 
     for item in entries[:limit_value]:
@@ -233,9 +557,10 @@ async def fetch_rss_news(_: Any, feed_url: str = "", limit: int | str = 3) -> st
         if guid and guid != link:
             entry_lines.append(f"GUID: {guid}")
         if summary:
-            cleaned = re.sub(r"<[^>]+>", " ", summary)
-            cleaned = unescape(cleaned)
-            cleaned = re.sub(r"\s+", " ", cleaned).strip()
+            cleaned = summary
+            if "<" in cleaned or "&" in cleaned:
+                cleaned = unescape(_TAG_RE.sub(" ", cleaned))
+            cleaned = _WS_RE.sub(" ", cleaned).strip()
             if cleaned:
                 entry_lines.append(f"Коротко: {cleaned}")
 
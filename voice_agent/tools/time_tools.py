@@ -1,7 +1,30 @@
+import functools
 import os
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone, timedelta, tzinfo
 from typing import Any
 
+try:
+    from zoneinfo import ZoneInfo  # Python 3.9+
+except ImportError:  # pragma: no cover - zoneinfo may be unavailable
+    ZoneInfo = None  # type: ignore[assignment,misc]
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_tz(tz_name: str, offset_override: str) -> tzinfo:
+    """Build the tzinfo for the configured zone once; falls back to a fixed offset."""
+
+    if ZoneInfo is not None:
+        try:
+            return ZoneInfo(tz_name)
+        except Exception:  # pragma: no cover - unknown zone or missing tzdata
+            pass
+
+    try:
+        hours = int(offset_override) if offset_override else 3
+    except ValueError:
+        hours = 3
+    return timezone(timedelta(hours=hours))
+
 
 async def current_time_utc_plus3(_: Any) -> str:
     """Return the current time in the configured timezone (defaults to UTC+3)."""
@@ -9,22 +32,9 @@ async def current_time_utc_plus3(_: Any) -> str:
     tz_name = os.getenv("VOICE_AGENT_TIMEZONE", "Europe/Kyiv").strip() or "Europe/Kyiv"
     offset_override = os.getenv("VOICE_AGENT_TIME_OFFSET_HOURS", "").strip()
 
-    tzinfo = None
-    try:
-        from zoneinfo import ZoneInfo  # Python 3.9+
-
-        tzinfo = ZoneInfo(tz_name)
-    except Exception:  # pragma: no cover - zoneinfo may be unavailable
-        tzinfo = None
-
-    if tzinfo is None:
-        try:
-            hours = int(offset_override) if offset_override else 3
-        except ValueError:
-            hours = 3
-        tzinfo = timezone(timedelta(hours=hours))
+    tz = _resolve_tz(tz_name, offset_override)
 
-    now = datetime.now(tzinfo)
+    now = datetime.now(tz)
     offset = now.utcoffset() or timedelta()
     total_minutes = int(offset.total_seconds() // 60)
     sign = "+" if total_minutes >= 0 else "-"
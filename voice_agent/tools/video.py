@@ -20,7 +20,8 @@ async def enable_video_feed(agent: Any) -> str:
         return "Відео вже увімкнене."
 
     session.input.set_video_enabled(True)
-    _VIDEO_LOGGER.info("Video feed enabled by request")
+    if _VIDEO_LOGGER.isEnabledFor(logging.INFO):
+        _VIDEO_LOGGER.info("Video feed enabled by request")
     return "Добре, я бачу відео. Дайте знати, що саме потрібно показати."
 
 
@@ -35,5 +36,6 @@ async def disable_video_feed(agent: Any) -> str:
         return "Відео вже вимкнене."
 
     session.input.set_video_enabled(False)
-    _VIDEO_LOGGER.info("Video feed disabled on request")
+    if _VIDEO_LOGGER.isEnabledFor(logging.INFO):
+        _VIDEO_LOGGER.info("Video feed disabled on request")
     return "Вимкнула відео. Якщо знадобиться знову, просто скажіть."